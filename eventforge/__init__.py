@@ -41,9 +41,11 @@ from eventforge.transports import (
     TransportFullError,
 )
 from eventforge.types import (
+    AtomicInt,
     Message,
     RPCRequest,
     RPCResponse,
+    ShardedCounter,
     SharedState,
     TaskContext,
     TaskRequest,
@@ -64,6 +66,8 @@ __all__ = [
     "TaskStatus",
     "TaskContext",
     "SharedState",
+    "ShardedCounter",
+    "AtomicInt",
     "RPCRequest",
     "RPCResponse",
     "ExecutionContext",
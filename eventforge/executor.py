@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
 import os
 import threading
 import time
+import weakref
 from collections.abc import Callable, Iterable
-from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from enum import Enum
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
@@ -39,6 +42,10 @@ def _run_with_timing(
     ``args`` / ``kwargs`` internally (a Python fundamental for cross-process
     dispatch). The previous custom ``pickle.dumps`` / ``pickle.loads`` layer
     around this function was redundant -- removed.
+
+    The returned keys are exactly :class:`TaskResult`'s fields, so the
+    parent rebuilds the result with a single ``TaskResult(**raw)`` instead
+    of re-mapping each key by hand.
     """
     start = time.time()
     try:
@@ -48,6 +55,7 @@ def _run_with_timing(
             "status": "completed",
             "value": result,
             "error": None,
+            "error_type": None,
             "execution_time": time.time() - start,
             "worker_id": f"process-{os.getpid()}",
         }
@@ -63,19 +71,154 @@ def _run_with_timing(
         }
 
 
+# Event loops reused across _run_coroutine calls instead of asyncio.run()
+# building and tearing one down (selector, default executor, asyncgen
+# hooks) per call: one loop per calling thread, held by a thread-local
+# holder whose finalizer closes the loop once its thread exits.
+_THREAD_LOOPS = threading.local()
+
+
+def _reset_loops_after_fork() -> None:
+    # A forked PROCESS-mode worker must not reuse the parent's loops: their
+    # selector fds are shared with the parent.
+    global _THREAD_LOOPS
+    _THREAD_LOOPS = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_loops_after_fork)
+
+
+class _LoopHolder:
+    """Owns one thread's reusable loop; closes it when garbage collected."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, self.loop.close)
+
+
+def _finish_run(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel what a coroutine left behind on ``loop``, as asyncio.run does.
+
+    Stray tasks and async generators must not leak into the next call
+    that reuses the loop.
+    """
+    tasks = asyncio.all_tasks(loop)
+    if tasks:
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    loop.run_until_complete(loop.shutdown_asyncgens())
+
+
+def _run_on_helper_thread(coro: Any) -> Any:
+    """Run ``coro`` with asyncio.run in a short-lived thread and wait for it."""
+    outcome: Dict[str, Any] = {}
+
+    def run() -> None:
+        try:
+            outcome["value"] = asyncio.run(coro)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, name="eventforge-loop-nested", daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """Drive ``coro`` to completion from synchronous code.
+
+    Callers normally run on a worker / delivery thread with no event loop;
+    the coroutine then runs on that thread's persistent loop. In-process
+    transports deliver on the publisher's thread, though, which may
+    already be running a loop (e.g. ``RPCClient.call_async``); that loop
+    can't be re-entered, so the coroutine gets its own helper thread and
+    this thread blocks on the result. Such calls from different threads
+    therefore still run concurrently, and nested ones cannot deadlock.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        return _run_on_helper_thread(coro)
+    holder: Optional[_LoopHolder] = getattr(_THREAD_LOOPS, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _THREAD_LOOPS.holder = _LoopHolder()
+    loop = holder.loop
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        _finish_run(loop)
+
+
+def _call_coroutine_function(
+    func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Call an ``async def`` function and drive it to completion.
+
+    Module-level (not a closure) so ``partial(_call_coroutine_function,
+    func)`` stays picklable for PROCESS-mode executors.
+    """
+    return _run_coroutine(func(*args, **kwargs))
+
+
+def _as_task_result(raw: Union[TaskResult, Dict[str, Any]]) -> TaskResult:
+    """Normalize a future's outcome: process mode returns a plain dict."""
+    if isinstance(raw, dict):
+        return TaskResult(**raw)
+    return raw
+
+
+def _log_detached_failure(future: Future[Any]) -> None:
+    """Done-callback for :meth:`Executor.submit_detached` futures."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("detached task failed", exc_info=exc)
+
+
 class Executor:
-    """Unified task executor with multiple execution modes."""
+    """Unified task executor with multiple execution modes.
+
+    Args:
+        mode: How submitted tasks run (see :class:`ExecutionMode`).
+        max_workers: Pool size for THREAD / PROCESS modes.
+        mp_context: PROCESS mode only -- ``multiprocessing`` start method
+            for the (persistent) worker pool, e.g. ``"fork"`` to skip the
+            interpreter start-up and re-import that ``"spawn"`` pays per
+            worker. ``None`` uses the platform default.
+    """
 
     def __init__(
         self,
         mode: ExecutionMode = ExecutionMode.SEQUENTIAL,
         max_workers: int = 4,
+        mp_context: Optional[str] = None,
     ):
-        self._mode = mode
+        # Normalized to the enum member (``"thread"`` is accepted too) so
+        # mode checks can be identity tests against the singletons.
+        self._mode = ExecutionMode(mode)
         self._max_workers = max_workers
+        # Resolved eagerly so an unknown start method fails at construction
+        # rather than on the first submit().
+        self._mp_context = (
+            multiprocessing.get_context(mp_context) if mp_context is not None else None
+        )
         self._results: Dict[str, TaskResult] = {}
         self._futures: Dict[str, Future[Union[TaskResult, Dict[str, Any]]]] = {}
-        self._lock = threading.RLock()
+        # Plain Lock: start/stop/result/_on_complete never re-enter it, and
+        # submit() calls start() before taking it.
+        self._lock = threading.Lock()
+        # Signalled (under self._lock) whenever a task id gains a future or a
+        # result, so result() can block on an id it doesn't know yet instead
+        # of sleep-polling for it.
+        self._settled = threading.Condition(self._lock)
         self._pool: Optional[Union[ThreadPoolExecutor, ProcessPoolExecutor]] = None
         self._running = False
 
@@ -91,15 +234,23 @@ class Executor:
         ``submit()`` concurrently on a fresh THREAD/PROCESS executor can no
         longer both pass the guard and each construct (and leak) their own
         pool.
+
+        ``submit()`` calls this on every task, so an already-running
+        executor returns after one unlocked flag read (double-checked
+        locking); only the first start pays for the lock.
         """
+        if self._running:
+            return
         with self._lock:
             if self._running:
                 return
 
-            if self._mode == ExecutionMode.THREAD:
+            if self._mode is ExecutionMode.THREAD:
                 self._pool = ThreadPoolExecutor(max_workers=self._max_workers)
-            elif self._mode == ExecutionMode.PROCESS:
-                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            elif self._mode is ExecutionMode.PROCESS:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers, mp_context=self._mp_context
+                )
 
             self._running = True
         logger.info(
@@ -132,10 +283,11 @@ class Executor:
         """Submit task for execution. Returns task_id."""
         task_id = str(uuid4())
 
-        if self._mode == ExecutionMode.SEQUENTIAL:
+        if self._mode is ExecutionMode.SEQUENTIAL:
             result = self._execute_sync(task_id, func, args, kwargs)
             with self._lock:
                 self._results[task_id] = result
+                self._settled.notify_all()
         else:
             # start() is idempotent and atomic under self._lock, so calling
             # it unconditionally (rather than an unlocked "if not running")
@@ -147,7 +299,7 @@ class Executor:
                 pool = self._pool
             assert pool is not None  # set by start() for non-sequential modes
             future: Future[Union[TaskResult, Dict[str, Any]]]
-            if self._mode == ExecutionMode.THREAD:
+            if self._mode is ExecutionMode.THREAD:
                 future = pool.submit(self._execute_sync, task_id, func, args, kwargs)
             else:
                 # Process mode: ProcessPoolExecutor pickles func/args/kwargs
@@ -156,16 +308,38 @@ class Executor:
 
             with self._lock:
                 self._futures[task_id] = future
+                self._settled.notify_all()
 
-            def _done(
-                f: Future[Union[TaskResult, Dict[str, Any]]], tid: str = task_id
-            ) -> None:
-                self._on_complete(tid, f)
-
-            future.add_done_callback(_done)
+            # partial (a C type) binds task_id without allocating a fresh
+            # Python function object per submit.
+            future.add_done_callback(partial(self._on_complete, task_id))
 
         return task_id
 
+    def submit_detached(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """Run ``func`` in the background without tracking its result.
+
+        For fire-and-forget callers that never call :meth:`result` (e.g.
+        :class:`~eventforge.observers.ConcurrentDispatcher`): the call is
+        handed straight to the executor's long-lived pool -- no task id,
+        and no ``TaskResult`` left behind in ``_results`` per call.
+        Failures are logged. SEQUENTIAL mode runs ``func`` inline.
+        """
+        if self._mode is ExecutionMode.SEQUENTIAL:
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                logger.exception("detached task failed: %r", func)
+            return
+
+        self.start()
+        with self._lock:
+            pool = self._pool
+        assert pool is not None  # set by start() for non-sequential modes
+        pool.submit(func, *args, **kwargs).add_done_callback(_log_detached_failure)
+
     async def submit_async(
         self, func: Callable[..., Any], *args: Any, **kwargs: Any
     ) -> str:
@@ -181,47 +355,37 @@ class Executor:
         """Get task result (blocking)."""
         deadline = time.time() + timeout if timeout else None
 
-        while True:
-            with self._lock:
-                if task_id in self._results:
-                    return self._results[task_id]
-
+        # Wait for the id to gain a result or a future. The predicate is
+        # re-checked after every wake-up, so spurious or unrelated
+        # notifications just loop.
+        with self._settled:
+            while True:
+                done = self._results.get(task_id)
+                if done is not None:
+                    return done
                 future = self._futures.get(task_id)
+                if future is not None:
+                    break
+                remaining = deadline - time.time() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"Task {task_id} not found")
+                self._settled.wait(remaining)
 
-            if future:
-                try:
-                    remaining = deadline - time.time() if deadline else None
-                    if remaining is not None and remaining <= 0:
-                        raise TimeoutError(f"Task {task_id} timed out")
-
-                    raw = future.result(timeout=remaining)
-
-                    # Process mode returns dict
-                    if isinstance(raw, dict):
-                        return TaskResult(
-                            task_id=raw["task_id"],
-                            status=TaskStatus(raw["status"]),
-                            value=raw.get("value"),
-                            error=raw.get("error"),
-                            error_type=raw.get("error_type"),
-                            execution_time=raw.get("execution_time", 0),
-                            worker_id=raw.get("worker_id", ""),
-                        )
-                    return raw
-                except (TimeoutError, FuturesTimeoutError):
-                    raise TimeoutError(f"Task {task_id} timed out")
-                except Exception as e:
-                    return TaskResult(
-                        task_id=task_id,
-                        status=TaskStatus.FAILED,
-                        error=str(e),
-                        error_type=type(e).__name__,
-                    )
-
-            if deadline and time.time() >= deadline:
-                raise TimeoutError(f"Task {task_id} not found")
-
-            time.sleep(0.01)
+        try:
+            remaining = deadline - time.time() if deadline else None
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"Task {task_id} timed out")
+
+            return _as_task_result(future.result(timeout=remaining))
+        except (TimeoutError, FuturesTimeoutError):
+            raise TimeoutError(f"Task {task_id} timed out")
+        except Exception as e:
+            return TaskResult(
+                task_id=task_id,
+                status=TaskStatus.FAILED,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
 
     async def result_async(
         self, task_id: str, timeout: Optional[float] = None
@@ -238,7 +402,23 @@ class Executor:
     ) -> List[TaskResult]:
         """Map function over items."""
         task_ids = [self.submit(func, item) for item in items]
-        return [self.result(tid, timeout) for tid in task_ids]
+        # One deadline for the whole call, shared by the batch wait and the
+        # per-id collection, so a stuck batch gives up after ``timeout``.
+        deadline = time.time() + timeout if timeout else None
+
+        def remaining() -> Optional[float]:
+            # Never 0: result() reads a falsy timeout as "wait forever".
+            return None if deadline is None else max(deadline - time.time(), 1e-6)
+
+        # Join the whole batch with one ``wait()`` (a single shared waiter
+        # across every future) instead of blocking in ``result()`` on each
+        # future in turn; the per-id collection below then finds every
+        # result already settled.
+        with self._lock:
+            pending = [f for f in map(self._futures.get, task_ids) if f is not None]
+        if pending:
+            wait(pending, timeout=remaining())
+        return [self.result(tid, remaining()) for tid in task_ids]
 
     async def map_async(
         self,
@@ -285,17 +465,7 @@ class Executor:
     ) -> None:
         """Handle task completion."""
         try:
-            result = future.result()
-            if isinstance(result, dict):
-                result = TaskResult(
-                    task_id=result["task_id"],
-                    status=TaskStatus(result["status"]),
-                    value=result.get("value"),
-                    error=result.get("error"),
-                    error_type=result.get("error_type"),
-                    execution_time=result.get("execution_time", 0),
-                    worker_id=result.get("worker_id", ""),
-                )
+            result = _as_task_result(future.result())
         except Exception as e:
             result = TaskResult(
                 task_id=task_id,
@@ -307,6 +477,7 @@ class Executor:
         with self._lock:
             self._results[task_id] = result
             self._futures.pop(task_id, None)
+            self._settled.notify_all()
 
     def __enter__(self) -> "Executor":
         self.start()
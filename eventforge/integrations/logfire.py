@@ -92,7 +92,12 @@ class LogfireMeter(Meter):
         self._extract_attributes = extract_attributes
         self._log_args = log_args
         self._log_result = log_result
-        self._tags = list(tags) if tags else []
+        # Frozen once: the tags never change, so the tagged handle is built
+        # here instead of calling ``with_tags(*tags)`` on every span.
+        self._tags = tuple(tags) if tags else ()
+        self._handle = (
+            self._logfire.with_tags(*self._tags) if self._tags else self._logfire
+        )
         # Open spans keyed by id(ctx); a task's lifecycle is on one
         # thread per call, but multiple concurrent tasks each need
         # their own span entry. id(ctx) is unique per call.
@@ -107,9 +112,7 @@ class LogfireMeter(Meter):
         return self._span_name
 
     def _logfire_handle(self) -> Any:
-        if self._tags:
-            return self._logfire.with_tags(*self._tags)
-        return self._logfire
+        return self._handle
 
     def on_start(self, ctx: Context) -> None:
         attrs: Dict[str, Any] = {}
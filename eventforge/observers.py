@@ -49,7 +49,9 @@ Lifecycle event names (extensible; just call ``self.fire("name", ...)``):
 
 from __future__ import annotations
 
+import inspect
 import logging
+import math
 import resource
 import threading
 import time
@@ -58,13 +60,16 @@ import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from types import FunctionType
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
     List,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -136,13 +141,14 @@ class Dispatcher(ABC):
     Subclasses implement the actual routing: broadcast to all, round-robin
     one at a time, concurrent fanout via an executor pool, push to a queue
     for competing consumers, send over a transport for cross-process
-    delivery, or anything else.
+    delivery, or anything else. ``dispatch`` is called on every fire,
+    even when the channel has no local subscribers.
     """
 
     @abstractmethod
     def dispatch(
         self,
-        subscribers: List[Callable[..., Any]],
+        subscribers: Sequence[Callable[..., Any]],
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
     ) -> None: ...
@@ -171,7 +177,7 @@ class BroadcastDispatcher(Dispatcher):
 
     def dispatch(
         self,
-        subscribers: List[Callable[..., Any]],
+        subscribers: Sequence[Callable[..., Any]],
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
     ) -> None:
@@ -192,7 +198,7 @@ class RoundRobinDispatcher(Dispatcher):
 
     def dispatch(
         self,
-        subscribers: List[Callable[..., Any]],
+        subscribers: Sequence[Callable[..., Any]],
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
     ) -> None:
@@ -211,23 +217,99 @@ class ConcurrentDispatcher(Dispatcher):
     """Submit each subscriber to an executor pool (thread / process).
 
     Subscribers run in parallel; fire returns immediately.
+
+    Pass ``inline_threshold_ns`` to make the choice workload-adaptive: an
+    EWMA of per-subscriber run time is kept, and a fire whose estimated
+    total work (mean * n_subscribers) is below the threshold runs inline
+    on the caller's thread, skipping pool hand-off for cheap callbacks
+    while slow ones still fan out. Timed subscribers are submitted via a
+    bound method of the dispatcher, so this is meant for thread pools --
+    it won't pickle across a process pool.
+
+    Pass ``inline_single=True`` to run a fire with exactly one subscriber
+    on the caller's thread: with nothing to run alongside it, the pool
+    hand-off only adds a context switch. That fire then blocks until the
+    subscriber returns, so leave it off where ``fire`` must never block.
     """
 
-    def __init__(self, executor: Executor) -> None:
+    #: Weight of the newest sample in the run-time EWMA.
+    EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        executor: Executor,
+        inline_threshold_ns: Optional[int] = None,
+        inline_single: bool = False,
+    ) -> None:
         self._executor = executor
+        # Subscribers are fire-and-forget, so an eventforge Executor is fed
+        # through submit_detached(): no task id / TaskResult is recorded
+        # (and never collected) per subscriber per fire. Plain
+        # concurrent.futures pools only have submit().
+        self._submit: Callable[..., Any] = getattr(
+            executor, "submit_detached", executor.submit
+        )
+        self.inline_threshold_ns = inline_threshold_ns
+        self.inline_single = inline_single
+        # None until the first sample; the first fire therefore runs inline
+        # and seeds the estimate. Racy float updates are fine -- it is only
+        # a heuristic.
+        self._mean_ns: Optional[float] = None
 
     def dispatch(
         self,
-        subscribers: List[Callable[..., Any]],
+        subscribers: Sequence[Callable[..., Any]],
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
     ) -> None:
+        if self.inline_single and len(subscribers) == 1:
+            fn = subscribers[0]
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                logger.exception("concurrent subscriber failed: %r", fn)
+            return
+
+        # Per-fire invariants are bound once here, not re-resolved per
+        # subscriber inside the loops below.
+        submit = self._submit
+        threshold = self.inline_threshold_ns
+        if threshold is None:
+            for fn in subscribers:
+                try:
+                    submit(fn, *args, **kwargs)
+                except Exception:
+                    logger.exception("concurrent submit failed: %r", fn)
+            return
+
+        timed = self._timed
+        mean = self._mean_ns
+        if mean is None or mean * len(subscribers) < threshold:
+            for fn in subscribers:
+                try:
+                    timed(fn, args, kwargs)
+                except Exception:
+                    logger.exception("concurrent subscriber failed: %r", fn)
+            return
         for fn in subscribers:
             try:
-                self._executor.submit(fn, *args, **kwargs)
+                submit(timed, fn, args, kwargs)
             except Exception:
                 logger.exception("concurrent submit failed: %r", fn)
 
+    def _timed(
+        self, fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Any:
+        t0 = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            sample = time.perf_counter_ns() - t0
+            mean = self._mean_ns
+            self._mean_ns = (
+                sample if mean is None else mean + self.EWMA_ALPHA * (sample - mean)
+            )
+
 
 class LeastLoadedDispatcher(Dispatcher):
     """Route each fire to the least-loaded subscriber, reserving atomically.
@@ -243,7 +325,7 @@ class LeastLoadedDispatcher(Dispatcher):
     def __init__(self) -> None:
         self._lock = threading.Lock()
 
-    def _select(self, subscribers: List[Callable[..., Any]]) -> "Tuple[Any, bool]":
+    def _select(self, subscribers: Sequence[Callable[..., Any]]) -> "Tuple[Any, bool]":
         """Atomically pick and reserve the least-loaded subscriber.
 
         Returns ``(subscriber, reserved)`` -- ``reserved`` is True when it's a
@@ -252,17 +334,22 @@ class LeastLoadedDispatcher(Dispatcher):
         reading ``load()`` and committing. Raises if every subscriber is full.
         """
         with self._lock:
-            for sub in sorted(subscribers, key=lambda s: cast("LoadAware", s).load()):
+            # Each subscriber's load() is read once and reused for both the
+            # ranking and the saturation check (a Node's load() takes its
+            # lock, so the old second read cost another acquire per pick).
+            loads = [cast("LoadAware", s).load() for s in subscribers]
+            for i in sorted(range(len(loads)), key=loads.__getitem__):
+                sub = subscribers[i]
                 if isinstance(sub, Node):
                     if sub.try_acquire():
                         return sub, True
-                elif cast("LoadAware", sub).load() < 1.0:
+                elif loads[i] < 1.0:
                     return sub, False
         raise RuntimeError("all subscribers saturated")
 
     def route(
         self,
-        subscribers: List[Callable[..., Any]],
+        subscribers: Sequence[Callable[..., Any]],
         *args: Any,
         **kwargs: Any,
     ) -> Any:
@@ -284,7 +371,7 @@ class LeastLoadedDispatcher(Dispatcher):
 
     def dispatch(
         self,
-        subscribers: List[Callable[..., Any]],
+        subscribers: Sequence[Callable[..., Any]],
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
     ) -> None:
@@ -325,8 +412,11 @@ class Eventful:
         owner: Optional[Observable] = None,
         name: Optional[str] = None,
     ) -> None:
-        self._subscribers: List[Callable[..., Any]] = []
-        self._dispatcher = dispatcher or BroadcastDispatcher()
+        # Copy-on-write: mutations swap in a new tuple under the lock, so
+        # fire() hands the current tuple to the Dispatcher as-is -- no lock
+        # and no per-fire list copy.
+        self._subscribers: Tuple[Callable[..., Any], ...] = ()
+        self.set_dispatcher(dispatcher or BroadcastDispatcher())
         self._lock = threading.Lock()
         # When owner+name are set, fire() also walks owner's MRO for
         # class-level subscribers. Avoids the previous monkey-patch
@@ -337,7 +427,7 @@ class Eventful:
     def subscribe(self, fn: Callable[..., Any]) -> Callable[..., Any]:
         """Register ``fn`` to receive every fire on this channel. Returns ``fn``."""
         with self._lock:
-            self._subscribers.append(fn)
+            self._subscribers = self._subscribers + (fn,)
         return fn
 
     # Convenience alias.
@@ -345,49 +435,63 @@ class Eventful:
 
     def unsubscribe(self, fn: Callable[..., Any]) -> bool:
         with self._lock:
+            subs = self._subscribers
             try:
-                self._subscribers.remove(fn)
-                return True
+                idx = subs.index(fn)
             except ValueError:
                 return False
+            self._subscribers = subs[:idx] + subs[idx + 1 :]
+            return True
 
     def fire(self, *args: Any, **kwargs: Any) -> None:
         """Dispatch to instance subscribers (via Dispatcher) and then to
         class-level subscribers registered via :func:`observe`, if this
         Eventful was constructed with ``owner`` + ``name``.
         """
-        with self._lock:
-            subs = list(self._subscribers)
-        self._dispatcher.dispatch(subs, args, kwargs)
+        subs = self._subscribers
+        if self._broadcast:
+            # Same loop as BroadcastDispatcher.dispatch, minus the method
+            # lookup + extra frame on the overwhelmingly common default;
+            # channels nobody subscribed to (e.g. a task's unused lifecycle
+            # events) fall straight through. Nearly every fire carries
+            # exactly one positional argument (a TaskContext or a Message);
+            # call subscribers with it directly rather than re-unpacking
+            # *args/**kwargs per call.
+            if len(args) == 1 and not kwargs:
+                (arg,) = args
+                for fn in subs:
+                    fn(arg)
+            else:
+                for fn in subs:
+                    fn(*args, **kwargs)
+        else:
+            # Custom dispatchers always run: one that forwards over a
+            # transport has no local subscribers at all.
+            self._dispatcher.dispatch(subs, args, kwargs)
 
         if self._owner is not None and self._name is not None:
-            for klass in type(self._owner).__mro__:
-                if klass is object:
-                    continue
-                with _CLASS_SUBSCRIBERS_LOCK:
-                    cls_subs = list(
-                        _CLASS_SUBSCRIBERS.get(klass, {}).get(self._name, ())
+            # Resolved once per (owner class, event) and cached until the
+            # next @observe registration -- not re-walked on every fire.
+            for klass, fn in _class_subscribers_for(type(self._owner), self._name):
+                try:
+                    fn(*args, **kwargs)
+                except Exception:
+                    logger.exception(
+                        "class subscriber for %s.%s failed: %r",
+                        klass.__name__,
+                        self._name,
+                        fn,
                     )
-                if not cls_subs:
-                    continue
-                for fn in cls_subs:
-                    try:
-                        fn(*args, **kwargs)
-                    except Exception:
-                        logger.exception(
-                            "class subscriber for %s.%s failed: %r",
-                            klass.__name__,
-                            self._name,
-                            fn,
-                        )
 
     @property
     def subscribers(self) -> List[Callable[..., Any]]:
-        with self._lock:
-            return list(self._subscribers)
+        return list(self._subscribers)
 
     def set_dispatcher(self, dispatcher: Dispatcher) -> None:
         self._dispatcher = dispatcher
+        # Exact type check: a BroadcastDispatcher subclass may override
+        # dispatch() and must still be called.
+        self._broadcast = type(dispatcher) is BroadcastDispatcher
 
 
 # =============================================================================
@@ -454,12 +558,56 @@ class Observable:
 
     def events(self) -> List[str]:
         """List of Eventful attribute names on this instance."""
-        return [
+        # Channels are almost always plain instance attributes, so read them
+        # straight out of ``__dict__``; only the (cached, per-class) names
+        # that could resolve to a class-level Eventful or a descriptor are
+        # probed with getattr -- no ``dir()`` walk over every method.
+        names = {
             name
-            for name in dir(self)
-            if not name.startswith("_")
-            and isinstance(getattr(self, name, None), Eventful)
-        ]
+            for name, value in getattr(self, "__dict__", {}).items()
+            if not name.startswith("_") and isinstance(value, Eventful)
+        }
+        for name in _class_event_candidates(type(self)):
+            if name not in names and isinstance(getattr(self, name, None), Eventful):
+                names.add(name)
+        return sorted(names)
+
+
+_CLASS_EVENT_CANDIDATES: weakref.WeakKeyDictionary[type, Tuple[str, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+_CLASS_EVENT_CANDIDATES_LOCK = threading.Lock()
+
+
+def _class_event_candidates(cls: type) -> Tuple[str, ...]:
+    """Cached public class attributes that may yield an Eventful on lookup.
+
+    Plain functions (methods) never do, so they are filtered out once per
+    class; what remains is class-level Eventfuls plus descriptors such as
+    properties and ``__slots__`` members, which :meth:`Observable.events`
+    still resolves per instance.
+    """
+    cached = _CLASS_EVENT_CANDIDATES.get(cls)
+    if cached is not None:
+        return cached
+    with _CLASS_EVENT_CANDIDATES_LOCK:
+        cached = _CLASS_EVENT_CANDIDATES.get(cls)
+        if cached is not None:
+            return cached
+        names = []
+        for attr in dir(cls):
+            if attr.startswith("_"):
+                continue
+            value = inspect.getattr_static(cls, attr, None)
+            if isinstance(value, (FunctionType, classmethod, staticmethod)):
+                continue
+            names.append(attr)
+        result = tuple(names)
+        try:
+            _CLASS_EVENT_CANDIDATES[cls] = result
+        except TypeError:
+            pass
+        return result
 
 
 # =============================================================================
@@ -609,6 +757,10 @@ class Meter(Observable):
                 f"unknown reduction {reduction!r}; choose from {sorted(REDUCTIONS)}"
             )
         self._reduction = reduction
+        # The reducer is resolved once here: ``value`` / ``stats`` then call
+        # it directly instead of re-looking the name up in REDUCTIONS on
+        # every read.
+        self._reduce: Callable[[Meter], float] = REDUCTIONS[reduction]
         if name is not None:
             self.name = name
         # Emission channels
@@ -638,6 +790,12 @@ class Meter(Observable):
         with self._state_lock:
             self.last: float = 0.0
             self.sum: float = 0.0
+            # Neumaier running sum: ``_raw_sum`` plus the accumulated
+            # rounding error ``_sum_err``; ``sum`` is their total. Long
+            # streams of small observations (per-call timings) otherwise
+            # drift as each addition rounds against a large total.
+            self._raw_sum = 0.0
+            self._sum_err = 0.0
             self.count: int = 0
             self.max_val: float = 0.0
             self.min_val: float = 0.0
@@ -647,14 +805,73 @@ class Meter(Observable):
         with self._state_lock:
             if self.count == 0:
                 self.max_val = self.min_val = val
-            else:
-                self.max_val = max(self.max_val, val)
-                self.min_val = min(self.min_val, val)
+            # Plain comparisons rather than max()/min(): no builtin call or
+            # argument tuple per observation, with identical results
+            # (including NaN, which never replaces the current bound).
+            elif val > self.max_val:
+                self.max_val = val
+            elif val < self.min_val:
+                self.min_val = val
             self.last = val
-            self.sum += val * n
+            self._add_to_sum(val * n)
             self.count += n
         self.update_event.fire(self, val, n)
 
+    def update_many(self, values: Iterable[float]) -> None:
+        """Accumulate a batch of observations (each with ``n=1``).
+
+        Equivalent to calling :meth:`update` once per value, but the batch
+        is folded with ``math.fsum`` / ``max`` / ``min`` -- C loops over
+        the whole sequence -- under a single ``_state_lock``
+        acquisition instead of one Python-level read-modify-write per
+        value. ``update_event`` still fires once per value, in order.
+        """
+        vals = list(values)
+        if not vals:
+            return
+        lo, hi = min(vals), max(vals)
+        # fsum raises on overflow and on inf + -inf where update() would
+        # just carry inf / NaN; such batches are folded value by value.
+        total: Optional[float]
+        try:
+            total = math.fsum(vals)
+        except (OverflowError, ValueError):
+            total = None
+        if total is not None and not math.isfinite(total):
+            total = None
+        with self._state_lock:
+            if self.count == 0:
+                self.max_val, self.min_val = hi, lo
+            else:
+                self.max_val = max(self.max_val, hi)
+                self.min_val = min(self.min_val, lo)
+            self.last = vals[-1]
+            if total is None:
+                for val in vals:
+                    self._add_to_sum(val)
+            else:
+                self._add_to_sum(total)
+            self.count += len(vals)
+        for val in vals:
+            self.update_event.fire(self, val, 1)
+
+    def _add_to_sum(self, x: float) -> None:
+        # Neumaier compensated addition; caller holds ``_state_lock``.
+        s = self._raw_sum
+        t = s + x
+        if not math.isfinite(t):
+            # inf / overflow / NaN: the compensation term would compute
+            # ``inf - inf`` and turn the sum into NaN; carry ``t`` as is.
+            self.sum = self._raw_sum = t
+            self._sum_err = 0.0
+            return
+        if abs(s) >= abs(x):
+            self._sum_err += (s - t) + x
+        else:
+            self._sum_err += (x - t) + s
+        self._raw_sum = t
+        self.sum = t + self._sum_err
+
     @property
     def reduction(self) -> str:
         """The reduction name applied to produce ``value`` / ``stats``."""
@@ -664,13 +881,13 @@ class Meter(Observable):
     def value(self) -> float:
         """The single reduced metric, per the ``reduction`` (e.g. mean / max)."""
         with self._state_lock:
-            return REDUCTIONS[self._reduction](self)
+            return self._reduce(self)
 
     @property
     def stats(self) -> Dict[str, float]:
         with self._state_lock:
             return {
-                "value": REDUCTIONS[self._reduction](self),
+                "value": self._reduce(self),
                 "count": float(self.count),
             }
 
@@ -729,7 +946,9 @@ _METER_EVENT_NAMES_LOCK = threading.Lock()
 
 
 def _meter_event_names(meter_cls: type) -> Tuple[str, ...]:
-    """Cached scan of ``on_X`` callables on a Meter subclass.
+    """Cached scan of ``on_X`` callables on a Meter subclass (or any class
+    following the same ``on_<event>`` convention, e.g. plain observers
+    passed to :class:`~eventforge.task.TaskRunner`).
 
     ``dir()`` + ``startswith`` cost ~43 string ops per attach for a typical
     Meter; that scan is identical across all instances of the same class
@@ -809,11 +1028,49 @@ _CLASS_SUBSCRIBERS: Dict[type, Dict[str, List[Callable[..., Any]]]] = {}
 _CLASS_SUBSCRIBERS_LOCK = threading.Lock()
 
 
+ClassSubscribers = Tuple[Tuple[type, Callable[..., Any]], ...]
+
+# Per owner class: event name -> flattened ``(klass, fn)`` pairs across the
+# owner's MRO. Filled lazily by :func:`_class_subscribers_for` and dropped
+# wholesale on every registration (rare: once per Reporter instance).
+_RESOLVED_CLASS_SUBSCRIBERS: weakref.WeakKeyDictionary[
+    type, Dict[str, ClassSubscribers]
+] = weakref.WeakKeyDictionary()
+
+
 def _register_class_subscriber(
     target_cls: type, event: str, fn: Callable[..., Any]
 ) -> None:
     with _CLASS_SUBSCRIBERS_LOCK:
         _CLASS_SUBSCRIBERS.setdefault(target_cls, {}).setdefault(event, []).append(fn)
+        _RESOLVED_CLASS_SUBSCRIBERS.clear()
+
+
+def _class_subscribers_for(owner_cls: type, event: str) -> ClassSubscribers:
+    """Cached MRO walk of class-level subscribers for ``owner_cls.<event>``.
+
+    ``Eventful.fire`` used to walk ``owner_cls.__mro__`` and take
+    ``_CLASS_SUBSCRIBERS_LOCK`` once per class on every fire, even though
+    the answer only changes when a Reporter registers. The resolved tuple
+    is computed once under the lock and served lock-free afterwards.
+    """
+    per_cls = _RESOLVED_CLASS_SUBSCRIBERS.get(owner_cls)
+    if per_cls is not None:
+        cached = per_cls.get(event)
+        if cached is not None:
+            return cached
+    with _CLASS_SUBSCRIBERS_LOCK:
+        result = tuple(
+            (klass, fn)
+            for klass in owner_cls.__mro__
+            if klass is not object
+            for fn in _CLASS_SUBSCRIBERS.get(klass, {}).get(event, ())
+        )
+        try:
+            _RESOLVED_CLASS_SUBSCRIBERS.setdefault(owner_cls, {})[event] = result
+        except TypeError:
+            pass
+        return result
 
 
 # Each entry: (attr_name, ((target_cls, event), ...)) -- the @observe targets
@@ -852,7 +1109,7 @@ def _reporter_observe_methods(reporter_cls: type) -> ReporterMethods:
             method = getattr(reporter_cls, attr, None)
             targets = getattr(method, "_observe_targets", None)
             if targets:
-                pairs.append((attr, tuple(targets)))
+                pairs.append((attr, targets))
         result = tuple(pairs)
         try:
             _REPORTER_OBSERVE_METHODS[reporter_cls] = result
@@ -875,9 +1132,12 @@ def observe(
     """
 
     def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
-        existing = list(getattr(fn, "_observe_targets", []))
-        existing.append((target_cls, event))
-        fn._observe_targets = existing  # type: ignore[attr-defined]
+        # Immutable marker: stacking @observe builds a new tuple rather than
+        # mutating one that may be shared (e.g. the same function object
+        # re-decorated or assigned onto several Reporter classes), and the
+        # Reporter scan can cache it as-is without copying.
+        existing: ObserveTargets = getattr(fn, "_observe_targets", ())
+        fn._observe_targets = existing + ((target_cls, event),)  # type: ignore[attr-defined]
         return fn
 
     return deco
@@ -914,8 +1174,39 @@ class TimingMeter(Meter):
         return elapsed
 
 
+# tracemalloc hooks every allocation in the process, so MemoryMeter keeps it
+# on only while a measured call is in flight: the first ``on_start`` starts
+# it, the last matching ``on_complete`` stops it. Tracing that someone else
+# started is left alone.
+_TRACEMALLOC_LOCK = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+def _tracemalloc_acquire() -> None:
+    global _tracemalloc_users, _tracemalloc_owned
+    with _TRACEMALLOC_LOCK:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_owned = True
+        _tracemalloc_users += 1
+
+
+def _tracemalloc_release() -> None:
+    global _tracemalloc_users, _tracemalloc_owned
+    with _TRACEMALLOC_LOCK:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+
+
 class MemoryMeter(Meter):
-    """Tracks per-call memory delta via :mod:`tracemalloc`."""
+    """Tracks per-call memory delta via :mod:`tracemalloc`.
+
+    Tracing is scoped to measured calls: it is switched on in ``on_start``
+    and off again in ``on_complete`` once no other measured call needs it.
+    """
 
     name = "memory"
 
@@ -923,8 +1214,8 @@ class MemoryMeter(Meter):
         super().__init__(name=name, reduction=reduction)
 
     def on_start(self, ctx: Context) -> None:
-        if not tracemalloc.is_tracing():
-            tracemalloc.start()
+        _tracemalloc_acquire()
+        ctx.metadata[f"{self.name}_tracing"] = True
         current, _peak = tracemalloc.get_traced_memory()
         ctx.metadata[f"{self.name}_start"] = current
 
@@ -934,6 +1225,10 @@ class MemoryMeter(Meter):
         ctx.metadata[f"{self.name}_peak"] = peak
         return float(current - start)
 
+    def on_complete(self, ctx: Context) -> None:
+        if ctx.metadata.pop(f"{self.name}_tracing", False):
+            _tracemalloc_release()
+
 
 class CPUMeter(Meter):
     """Tracks per-call user+system CPU time via :func:`resource.getrusage`."""
@@ -46,7 +46,9 @@ class MessageQueue(Observable):
         self._sub_ids: Dict[str, Tuple[str, Handler]] = {}
         # topic -> transport subscription id (one transport sub per topic).
         self._transport_subs: Dict[str, str] = {}
-        self._lock = threading.RLock()
+        # Plain Lock: no method re-enters it (transport calls made under it
+        # take the transport's own lock).
+        self._lock = threading.Lock()
 
     # ---- topic management ----------------------------------------------
 
@@ -63,8 +65,9 @@ class MessageQueue(Observable):
         ``RoundRobinDispatcher`` for competing-consumer fan-in).
         """
         with self._lock:
-            if name in self._topics:
-                return self._topics[name]
+            channel = self._topics.get(name)
+            if channel is not None:
+                return channel
             channel = Eventful(dispatcher=dispatcher or BroadcastDispatcher())
             self._topics[name] = channel
             # Wire transport -> Eventful so cross-process delivery still
@@ -222,7 +225,9 @@ class MessageQueue(Observable):
         passed as a single arg.
         """
 
-        def handler(msg: Message) -> Any:
+        # ``task_func`` bound as a default: a fast local load per message
+        # instead of a closure-cell load.
+        def handler(msg: Message, task_func: Callable[..., Any] = task_func) -> Any:
             payload = msg.payload
             if isinstance(payload, dict):
                 return task_func(**payload)
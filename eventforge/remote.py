@@ -55,7 +55,9 @@ class RemoteQueue:
         self._local = local
         self._peers: Dict[str, MessageQueue] = {}
         self._transports: Dict[str, TCPClientTransport] = {}
-        self._lock = threading.RLock()
+        # Plain Lock: held only around dict updates (and the broadcast
+        # snapshot), never re-entered.
+        self._lock = threading.Lock()
 
     @property
     def node_id(self) -> str:
@@ -98,8 +100,10 @@ class RemoteQueue:
 
     def send(self, node_id: str, topic: str, payload: Any, **headers: Any) -> str:
         """Push a message to one peer. Returns the message id."""
-        with self._lock:
-            peer = self._peers.get(node_id)
+        # Read-mostly: peers change only on connect/disconnect, which swap
+        # whole entries under the lock. The per-send lookup is a lock-free
+        # ``dict.get``, so concurrent senders don't serialize here.
+        peer = self._peers.get(node_id)
         if peer is None:
             raise KeyError(f"not connected to node {node_id!r}")
         return peer.publish(topic, payload, **headers)
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import threading
 import time
-from collections.abc import Callable
-from typing import Any, Dict, List, Optional, Tuple, Type
+from collections.abc import Callable, Iterable
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
-from eventforge.executor import Executor
+from eventforge.executor import Executor, _run_coroutine
 from eventforge.queue import MessageQueue
 from eventforge.types import Message, RPCRequest, RPCResponse
 
+# (callable, is_coroutine_function), resolved once at registration.
+_MethodEntry = Tuple[Callable[..., Any], bool]
+
 
 class RPCServer:
     """RPC server: handles method calls as Eventful subscribers on the
@@ -34,7 +39,11 @@ class RPCServer:
         self._queue = queue
         self._executor = executor or Executor()
         self._service_name = service_name
-        self._methods: Dict[str, Callable[..., Any]] = {}
+        # Read on every request, written only by add_method(): lookups are
+        # a lock-free ``dict.get`` (atomic; entries are published whole), so
+        # concurrent requests never serialize on the registry. The lock
+        # orders registrations only.
+        self._methods: Dict[str, _MethodEntry] = {}
         self._methods_lock = threading.Lock()
         self._running = False
         self._sub_id: Optional[str] = None
@@ -46,17 +55,21 @@ class RPCServer:
         """Decorator to register RPC method."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            method_name = name or func.__name__
-            with self._methods_lock:
-                self._methods[method_name] = func
+            self.add_method(name or func.__name__, func)
             return func
 
         return decorator
 
     def add_method(self, name: str, func: Callable[..., Any]) -> None:
-        """Register method directly."""
+        """Register method directly. ``async def`` methods are supported.
+
+        Whether ``func`` is a coroutine function is checked once here and
+        stored alongside it, so request handling never re-runs the
+        ``__wrapped__``-walking ``iscoroutinefunction`` probe.
+        """
+        entry = (func, inspect.iscoroutinefunction(func))
         with self._methods_lock:
-            self._methods[name] = func
+            self._methods[name] = entry
 
     def serve(self, blocking: bool = True) -> None:
         """Subscribe the dispatch handler to the request topic. When
@@ -71,9 +84,12 @@ class RPCServer:
         topic = f"{self._service_name}.request"
         self._sub_id = self._queue.on(topic, self._handle_request)
         if blocking:
+            # stop() sets the event and wakes us directly; the long timeout
+            # only exists because an untimed wait cannot be interrupted by
+            # Ctrl+C on Windows.
             try:
-                while not self._stop_event.is_set():
-                    self._stop_event.wait(timeout=1.0)
+                while not self._stop_event.wait(60):
+                    pass
             except KeyboardInterrupt:
                 pass
 
@@ -113,9 +129,8 @@ class RPCServer:
                 self._queue.publish(msg.reply_to, response.model_dump())
             return
 
-        with self._methods_lock:
-            method = self._methods.get(request.method)
-        if not method:
+        entry = self._methods.get(request.method)
+        if entry is None:
             if msg.reply_to:
                 response = RPCResponse(
                     id=str(uuid4()),
@@ -126,8 +141,11 @@ class RPCServer:
                 self._queue.publish(msg.reply_to, response.model_dump())
             return
 
+        method, is_coro = entry
         try:
             result = method(*request.args, **request.kwargs)
+            if is_coro:
+                result = _run_coroutine(result)
             response = RPCResponse(
                 id=str(uuid4()), request_id=request.id, result=result
             )
@@ -237,11 +255,10 @@ class RPCClient:
 
     def __getattr__(self, name: str) -> Callable[..., Any]:
         """Allow client.method_name(*args) syntax."""
-
-        def caller(*args: Any, **kwargs: Any) -> Any:
-            return self.call(name, *args, **kwargs)
-
-        return caller
+        # A C-level partial rather than a ``*args, **kwargs`` closure: the
+        # proxy forwards straight into call() with no extra Python frame
+        # re-packing the arguments on every remote call.
+        return functools.partial(self.call, name)
 
 
 class RoundRobinRPCClient:
@@ -284,10 +301,7 @@ class RoundRobinRPCClient:
         return self._next_client().call(method, *args, timeout=timeout, **kwargs)
 
     def __getattr__(self, name: str) -> Callable[..., Any]:
-        def caller(*args: Any, **kwargs: Any) -> Any:
-            return self.call(name, *args, **kwargs)
-
-        return caller
+        return functools.partial(self.call, name)
 
 
 def with_retry(
@@ -296,7 +310,10 @@ def with_retry(
     max_retries: int = 3,
     backoff_initial: float = 0.1,
     backoff_factor: float = 2.0,
-    retry_on: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError),
+    retry_on: Union[Type[BaseException], Iterable[Type[BaseException]]] = (
+        TimeoutError,
+        ConnectionError,
+    ),
 ) -> "RPCClient":
     """Wrap ``client`` so each ``call()`` retries up to ``max_retries`` times.
 
@@ -305,7 +322,14 @@ def with_retry(
 
     Only the exception types in ``retry_on`` trigger a retry; everything
     else propagates immediately so application errors aren't masked.
+    ``retry_on`` may be a single exception class or any iterable of them.
     """
+    # Normalized once: ``except`` only accepts a class or a *tuple* of
+    # classes, so a list/set would otherwise raise TypeError -- and only
+    # at the moment the first error needed matching.
+    retry_types: Tuple[Type[BaseException], ...] = (
+        (retry_on,) if isinstance(retry_on, type) else tuple(retry_on)
+    )
 
     class _RetryingClient(RPCClient):
         def __init__(self) -> None:
@@ -313,17 +337,20 @@ def with_retry(
             self._max_retries = max_retries
             self._backoff_initial = backoff_initial
             self._backoff_factor = backoff_factor
-            self._retry_on = retry_on
+            self._retry_on = retry_types
 
         def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
             delay = self._backoff_initial
+            max_retries = self._max_retries
+            retry_on = self._retry_on
+            call = self._client.call
             last_exc: Optional[BaseException] = None
-            for attempt in range(self._max_retries + 1):
+            for attempt in range(max_retries + 1):
                 try:
-                    return self._client.call(method, *args, **kwargs)
-                except self._retry_on as exc:
+                    return call(method, *args, **kwargs)
+                except retry_on as exc:
                     last_exc = exc
-                    if attempt == self._max_retries:
+                    if attempt == max_retries:
                         raise
                     time.sleep(delay)
                     delay *= self._backoff_factor
@@ -332,9 +359,6 @@ def with_retry(
             raise last_exc  # pragma: no cover
 
         def __getattr__(self, name: str) -> Callable[..., Any]:
-            def caller(*args: Any, **kwargs: Any) -> Any:
-                return self.call(name, *args, **kwargs)
-
-            return caller
+            return functools.partial(self.call, name)
 
     return _RetryingClient()
@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 import functools
+import inspect
 import logging
 import threading
 import time
+import types
 
 # ``Callable`` is subscripted at runtime in the ContextHandler alias below; the
 # typing alias is required on Python 3.8 (collections.abc generics are 3.9+).
 from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, cast
 from uuid import uuid4
 
-from eventforge.executor import ExecutionMode, Executor
-from eventforge.observers import Eventful, Meter, Observable
+from eventforge.executor import ExecutionMode, Executor, _call_coroutine_function
+from eventforge.observers import Eventful, Meter, Observable, _meter_event_names
 from eventforge.types import Message, SharedState, TaskContext
 
 logger = logging.getLogger(__name__)
@@ -48,6 +50,30 @@ class TaskCallable(Protocol):
     def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
 
+class _TaskWrapper(functools.partial):  # type: ignore[type-arg]
+    """What :func:`task` returns: ``partial(runner.run)`` plus metadata.
+
+    ``functools.partial`` is implemented in C, so calling a task goes from
+    the caller straight into :meth:`TaskRunner.run` with no Python-level
+    forwarding frame. The two things a plain wrapper function did for free
+    are kept: binding as a method when used as a class attribute, and
+    pickling by reference (module + qualified name).
+    """
+
+    __qualname__: str  # per-instance, copied from the task body by update_wrapper
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+    def __reduce__(self) -> str:
+        return self.__qualname__
+
+    def __repr__(self) -> str:
+        return f"<task {self.__qualname__}>"
+
+
 class TaskPool:
     """Manages a pool of task instances with concurrency limiting.
 
@@ -85,10 +111,19 @@ class TaskPool:
         Returns:
             True if slot acquired, False if timeout/non-blocking failed
         """
+        # Fast path: when a slot is free, take it without ever counting as
+        # queued -- one trip through self._lock instead of two.
+        if self._semaphore.acquire(blocking=False):
+            with self._lock:
+                self._active += 1
+            return True
+        if not blocking:
+            return False
+
         with self._lock:
             self._queued += 1
 
-        acquired = self._semaphore.acquire(blocking=blocking, timeout=timeout)
+        acquired = self._semaphore.acquire(timeout=timeout)
 
         with self._lock:
             self._queued -= 1
@@ -214,6 +249,12 @@ class TaskRunner(Observable):
     ):
         self.func = func
         self.topic = topic
+        # Per-call invariants resolved once instead of on every run():
+        # the function's name (read for the context and log lines) and the
+        # result topics built by f-string for each publish.
+        self._func_name: str = getattr(func, "__name__", repr(func))
+        self._success_topic = f"{topic}.success"
+        self._failure_topic = f"{topic}.failure"
         self.executor = executor or Executor()
         self.queue = queue
         self.publish_result = publish_result
@@ -226,20 +267,18 @@ class TaskRunner(Observable):
         self.complete: Eventful = Eventful()
 
         # Subscribe Meters / Observables that brought their own ``attach``.
-        for obs in on_execute or []:
+        for obs in on_execute or ():
             if isinstance(obs, Meter):
                 obs.attach(self)
             elif hasattr(obs, "attach"):
                 obs.attach(self)
             else:
                 # Plain Observer-style object with on_<event> methods:
-                # wire each ``on_X`` method to the matching channel.
-                for attr in dir(type(obs)):
-                    if not attr.startswith("on_"):
-                        continue
-                    method = getattr(obs, attr, None)
-                    if not callable(method):
-                        continue
+                # wire each ``on_X`` method to the matching channel. The
+                # ``on_X`` scan is the same per-class cache Meter.attach
+                # uses, so repeated runners skip the ``dir()`` walk.
+                for attr in _meter_event_names(type(obs)):
+                    method = getattr(obs, attr)
                     channel = getattr(self, attr[3:], None)
                     if isinstance(channel, Eventful):
                         channel.subscribe(method)
@@ -259,6 +298,24 @@ class TaskRunner(Observable):
         self.instance_timeout = instance_timeout
         self.pool = TaskPool(max_instances) if max_instances else None
 
+        # Specialize the body call once: the executor's mode can't change,
+        # so pick inline vs. submit-and-wait here rather than re-testing
+        # it on every run().
+        #
+        # Likewise whether ``func`` is ``async def`` is checked once; the
+        # coroutine is then driven to completion wherever the body runs,
+        # so callers and observers see its result, not a coroutine object.
+        self._body: Callable[..., Any] = (
+            functools.partial(_call_coroutine_function, func)
+            if inspect.iscoroutinefunction(func)
+            else func
+        )
+        self._call_body: Callable[[Tuple[Any, ...], Dict[str, Any]], Any] = (
+            self._call_inline
+            if self.executor.mode is ExecutionMode.SEQUENTIAL
+            else self._call_on_executor
+        )
+
     def run(self, *args: Any, **kwargs: Any) -> Any:
         """Execute task with full lifecycle.
 
@@ -272,21 +329,31 @@ class TaskRunner(Observable):
         8. Release pool slot
         9. Return result (or raise exception)
         """
-        # 1. Acquire pool slot if concurrency limiting is enabled
-        if self.pool:
-            acquired = self.pool.acquire(blocking=True, timeout=self.instance_timeout)
-            if not acquired:
-                raise TimeoutError(
-                    f"Timeout waiting for available slot in task pool "
-                    f"(max_instances={self.max_instances})"
-                )
+        # 1. Acquire pool slot if concurrency limiting is enabled; without
+        # a pool there is nothing to release, so skip the try/finally.
+        pool = self.pool
+        if pool is None:
+            return self._execute(args, kwargs)
+
+        acquired = pool.acquire(blocking=True, timeout=self.instance_timeout)
+        if not acquired:
+            raise TimeoutError(
+                f"Timeout waiting for available slot in task pool "
+                f"(max_instances={self.max_instances})"
+            )
 
         try:
             return self._execute(args, kwargs)
         finally:
             # Release pool slot
-            if self.pool:
-                self.pool.release()
+            pool.release()
+
+    def _call_inline(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        return self._body(*args, **kwargs)
+
+    def _call_on_executor(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        task_id = self.executor.submit(self._body, *args, **kwargs)
+        return self.executor.result(task_id).value
 
     def _execute(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
         """Internal execution logic."""
@@ -295,7 +362,7 @@ class TaskRunner(Observable):
         # the full 122 bits of entropy a UUIDv4 carries.
         ctx = TaskContext(
             task_id=uuid4().hex,
-            func_name=self.func.__name__,
+            func_name=self._func_name,
             topic=self.topic,
             args=args,
             kwargs=kwargs,
@@ -308,38 +375,40 @@ class TaskRunner(Observable):
         if self.pool:
             ctx.metadata["pool_stats"] = self.pool.stats
 
-        logger.info(
-            "task.start id=%s topic=%s func=%s",
-            ctx.task_id,
-            self.topic,
-            self.func.__name__,
-        )
+        # Lifecycle log lines are opt-in via the logger level: when INFO is
+        # off, skip the calls (and the argument evaluation feeding them)
+        # entirely instead of paying for them on every run.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "task.start id=%s topic=%s func=%s",
+                ctx.task_id,
+                self.topic,
+                self._func_name,
+            )
         self.start.fire(ctx)
 
         try:
             # Run the body locally via the Executor: inline in SEQUENTIAL mode,
             # otherwise submit to the thread / process pool and wait.
-            if self.executor.mode == ExecutionMode.SEQUENTIAL:
-                ctx.result = self.func(*args, **kwargs)
-            else:
-                task_id = self.executor.submit(self.func, *args, **kwargs)
-                ctx.result = self.executor.result(task_id).value
+            ctx.result = self._call_body(args, kwargs)
         except Exception as e:
             ctx.error = e
             ctx.end_time = time.time()
-            logger.warning(
-                "task.failure id=%s topic=%s exc=%s elapsed=%.4fs: %s",
-                ctx.task_id,
-                self.topic,
-                type(e).__name__,
-                ctx.execution_time,
-                e,
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "task.failure id=%s topic=%s exc=%s elapsed=%.4fs: %s",
+                    ctx.task_id,
+                    self.topic,
+                    type(e).__name__,
+                    ctx.execution_time,
+                    e,
+                )
             self.failure.fire(ctx)
             if self.publish_result and self.queue:
                 try:
                     self.queue.publish(
-                        f"{self.topic}.failure",
+                        self._failure_topic,
                         {
                             "task_id": ctx.task_id,
                             "error": str(e),
@@ -352,17 +421,18 @@ class TaskRunner(Observable):
             raise
         else:
             ctx.end_time = time.time()
-            logger.info(
-                "task.success id=%s topic=%s elapsed=%.4fs",
-                ctx.task_id,
-                self.topic,
-                ctx.execution_time,
-            )
+            if log_info:
+                logger.info(
+                    "task.success id=%s topic=%s elapsed=%.4fs",
+                    ctx.task_id,
+                    self.topic,
+                    ctx.execution_time,
+                )
             self.success.fire(ctx)
             if self.publish_result and self.queue:
                 try:
                     self.queue.publish(
-                        f"{self.topic}.success",
+                        self._success_topic,
                         {
                             "task_id": ctx.task_id,
                             "result": ctx.result,
@@ -463,33 +533,33 @@ def task(
             max_instances=max_instances,
             instance_timeout=instance_timeout,
         )
+        # Bound once: the wrapper and the queue handler below both call it
+        # without an attribute lookup + bound-method allocation per call.
+        run = runner.run
 
         # Register queue subscription if queue provided
         if queue is not None:
-
-            def queue_handler(message: Message) -> Any:
+            # ``run`` is bound as a default argument (a fast local load
+            # rather than a closure-cell load); the transport only ever
+            # passes the message positionally.
+            def queue_handler(message: Message, run: Callable[..., Any] = run) -> Any:
                 """Handle messages from queue by invoking the task."""
                 payload = message.payload
 
                 # Smart argument unpacking
                 if isinstance(payload, dict):
                     # Dict payload -> kwargs
-                    return runner.run(**payload)
+                    return run(**payload)
                 elif isinstance(payload, (list, tuple)):
                     # List/tuple payload -> args
-                    return runner.run(*payload)
+                    return run(*payload)
                 else:
                     # Single value -> single arg
-                    return runner.run(payload)
+                    return run(payload)
 
             queue.on(_topic, queue_handler)
 
-        @functools.wraps(func)
-        def _wrapper(*args: Any, **kwargs: Any) -> Any:
-            """Execute task with full lifecycle support."""
-            return runner.run(*args, **kwargs)
-
-        wrapper = cast(TaskCallable, _wrapper)
+        wrapper = cast(TaskCallable, functools.update_wrapper(_TaskWrapper(run), func))
 
         # Attach metadata for introspection
         wrapper._runner = runner
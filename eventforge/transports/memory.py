@@ -3,17 +3,71 @@
 from __future__ import annotations
 
 import asyncio
-import fnmatch
+import re
 import threading
 from collections import defaultdict
-from collections.abc import Callable
 from queue import Empty, Full, Queue
-from typing import Dict, List, Optional
+
+# ``Callable`` is subscripted at runtime in the _Routes alias below; the
+# typing alias is required on Python 3.8 (collections.abc generics are 3.9+).
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
 from uuid import uuid4
 
 from eventforge.transports.base import Transport, TransportFullError
 from eventforge.types import Message
 
+# (pattern, compiled matcher or None, callback) per live subscription.
+_Routes = Tuple[Tuple[str, Optional[Pattern[str]], Callable[[Message], None]], ...]
+
+
+def _compile_topic_pattern(pattern: str) -> Optional[Pattern[str]]:
+    """Compile a subscription pattern into a segment-aware regex.
+
+    ``*`` matches a single ``.``-delimited segment, ``**`` any number of
+    segments. ``?`` and ``[...]`` keep their ``fnmatch`` meaning (any one
+    character / a character set, ``[!...]`` negated). Returns ``None`` for
+    wildcard-free patterns, which only ever match their own topic exactly.
+    """
+    if not any(c in pattern for c in "*?["):
+        return None
+    parts: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern[i : i + 2] == "**":
+            parts.append(".*")
+            i += 2
+            continue
+        i += 1
+        if c == "*":
+            parts.append("[^.]*")
+        elif c == "?":
+            parts.append(".")
+        elif c == "[":
+            # Same bracket rules as fnmatch.translate: a leading "!" negates
+            # and a "]" right after the opening bracket is literal; an
+            # unterminated "[" is itself a literal.
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                parts.append("\\[")
+                continue
+            stuff = pattern[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if stuff.startswith("!"):
+                stuff = "^" + stuff[1:]
+            elif stuff.startswith(("^", "[")):
+                stuff = "\\" + stuff
+            parts.append(f"[{stuff}]")
+        else:
+            parts.append(re.escape(c))
+    return re.compile("".join(parts), re.DOTALL)
+
 
 class MemoryTransport(Transport):
     """Thread-safe in-memory message transport."""
@@ -29,6 +83,15 @@ class MemoryTransport(Transport):
         # (sub, topic) pair (the previous O(N_subs * N_topics) walk was the
         # dominant cost in MessageQueue.publish per the profiler).
         self._sub_topic: Dict[str, str] = {}
+        # sub_id -> compiled matcher (None for exact-topic subscriptions),
+        # built once at subscribe time instead of re-translating the
+        # pattern on every send().
+        self._sub_matcher: Dict[str, Optional[Pattern[str]]] = {}
+        # Immutable (pattern, matcher, callback) snapshot of the live
+        # subscriptions, rebuilt lazily by send() after any (un)subscribe.
+        # Callbacks may (un)subscribe while send() iterates it, so no
+        # per-send copy is needed.
+        self._routes: Optional[_Routes] = None
         self._lock = threading.RLock()
         self._closed = False
 
@@ -52,25 +115,36 @@ class MemoryTransport(Transport):
 
             # Notify matching subscribers first so pub-sub delivery never
             # depends on whether anything ever drains the receive() queue
-            # for this topic. ``self._sub_topic[sub_id]`` gives the
-            # subscription's pattern in O(1); we only run the (potentially
-            # expensive) ``_matches`` check after that lookup.
-            for sub_id, callback in list(self._subscribers.items()):
-                sub_topic = self._sub_topic.get(sub_id)
-                if sub_topic is not None and self._matches(topic, sub_topic):
-                    try:
-                        callback(message)
-                    except Exception:
-                        pass  # Don't let callback errors break send
+            # for this topic. Exact patterns compare directly; wildcard
+            # subscriptions run their precompiled matcher -- no per-send
+            # translation.
+            routes = self._routes
+            if routes is None:
+                sub_topics = self._sub_topic
+                matchers = self._sub_matcher
+                routes = self._routes = tuple(
+                    (sub_topics[sub_id], matchers[sub_id], callback)
+                    for sub_id, callback in self._subscribers.items()
+                )
+            for pattern, matcher, callback in routes:
+                if pattern != topic and (
+                    matcher is None or matcher.fullmatch(topic) is None
+                ):
+                    continue
+                try:
+                    callback(message)
+                except Exception:
+                    pass  # Don't let callback errors break send
 
             # Bounded queue backing receive()/request(). Raise rather than
             # silently drop when full -- see TransportFullError docstring.
+            queue = self._queues[topic]
             try:
-                self._queues[topic].put_nowait(message)
+                queue.put_nowait(message)
             except Full:
                 raise TransportFullError(
                     f"transport queue for topic {topic!r} is full "
-                    f"({self._queues[topic].maxsize} messages)"
+                    f"({queue.maxsize} messages)"
                 ) from None
 
     def receive(self, topic: str, timeout: Optional[float] = None) -> Optional[Message]:
@@ -109,16 +183,19 @@ class MemoryTransport(Transport):
             self._subscribers[sub_id] = callback
             self._topic_subs[topic].append(sub_id)
             self._sub_topic[sub_id] = topic
+            self._sub_matcher[sub_id] = _compile_topic_pattern(topic)
+            self._routes = None
         return sub_id
 
     def unsubscribe(self, subscription_id: str) -> bool:
         """Unsubscribe by ID."""
         with self._lock:
-            if subscription_id not in self._subscribers:
+            if self._subscribers.pop(subscription_id, None) is None:
                 return False
 
-            del self._subscribers[subscription_id]
             topic = self._sub_topic.pop(subscription_id, None)
+            self._sub_matcher.pop(subscription_id, None)
+            self._routes = None
             if topic is not None:
                 subs = self._topic_subs.get(topic)
                 if subs and subscription_id in subs:
@@ -132,15 +209,5 @@ class MemoryTransport(Transport):
             self._subscribers.clear()
             self._topic_subs.clear()
             self._sub_topic.clear()
-
-    def _matches(self, topic: str, pattern: str) -> bool:
-        """Check if topic matches pattern (supports * and **)."""
-        if pattern == topic:
-            return True
-        # Convert pattern to fnmatch style
-        # ** matches any number of segments
-        # * matches single segment
-        pattern = pattern.replace("**", "__DOUBLE__")
-        pattern = pattern.replace("*", "[^.]*")
-        pattern = pattern.replace("__DOUBLE__", "*")
-        return fnmatch.fnmatch(topic, pattern)
+            self._sub_matcher.clear()
+            self._routes = None
@@ -249,9 +249,8 @@ class NatsTransport(Transport):
 
     def unsubscribe(self, subscription_id: str) -> bool:
         with self._lock:
-            if subscription_id not in self._subscribers:
+            if self._subscribers.pop(subscription_id, None) is None:
                 return False
-            del self._subscribers[subscription_id]
             self._sub_topic.pop(subscription_id, None)
             nats_sub = self._nats_subs.pop(subscription_id, None)
         if nats_sub is not None:
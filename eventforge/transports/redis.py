@@ -225,9 +225,8 @@ class RedisTransport(Transport):
 
     def unsubscribe(self, subscription_id: str) -> bool:
         with self._lock:
-            if subscription_id not in self._subscribers:
+            if self._subscribers.pop(subscription_id, None) is None:
                 return False
-            del self._subscribers[subscription_id]
             self._sub_topic.pop(subscription_id, None)
             pattern = self._sub_pattern.pop(subscription_id, None)
             if pattern is not None:
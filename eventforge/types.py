@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import threading
+import weakref
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator
@@ -121,6 +122,13 @@ class Subscription(BaseModel):
     pattern: bool = False  # True if topic is a pattern (e.g., "user.*")
 
 
+# Lock stripes per SharedState; a power of two so the stripe index is a mask.
+_STRIPES = 16
+_STRIPE_MASK = _STRIPES - 1
+# Distinguishes "absent" from a stored None in single-lookup reads.
+_MISSING = object()
+
+
 class SharedState:
     """Thread-safe shared state for observers and tasks.
 
@@ -143,22 +151,67 @@ class SharedState:
     """
 
     def __init__(self) -> None:
-        self._data: Dict[str, Any] = {}
-        self._lock = threading.RLock()
+        # The keyspace is striped over _STRIPES dicts, each with its own
+        # lock, so writers to unrelated keys don't contend on one mutex.
+        # A key always maps to the same stripe (``hash(key) & _STRIPE_MASK``).
+        # Stripes are copy-on-write: a writer clones its stripe's dict,
+        # edits the clone and publishes it with one list-slot store, so a
+        # published dict is never mutated again and readers need neither a
+        # lock nor a defensive copy. Writes cost O(stripe size), which is
+        # cheap for the handful of keys a task's observers share.
+        self._shards: List[Dict[str, Any]] = [{} for _ in range(_STRIPES)]
+        # Plain locks: writes from inside update()'s func are rejected
+        # below, so no code path takes a stripe lock it already holds.
+        self._locks: Tuple[threading.Lock, ...] = tuple(
+            threading.Lock() for _ in range(_STRIPES)
+        )
+        # Flags the thread currently running an update()'s ``func``. A
+        # write from there would either be overwritten when update()
+        # publishes its stripe or, on another stripe, take a second lock
+        # in caller-chosen order -- so writers refuse it outright.
+        self._updating = threading.local()
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get value by key."""
-        with self._lock:
-            return self._data.get(key, default)
+        """Get value by key.
+
+        Lock-free: the stripe's dict is an immutable snapshot, so a reader
+        can never observe a half-written entry. The locks only order
+        writers.
+        """
+        return self._shards[hash(key) & _STRIPE_MASK].get(key, default)
+
+    def _check_not_updating(self) -> None:
+        if getattr(self._updating, "active", False):
+            raise RuntimeError(
+                "SharedState cannot be written from inside update()'s func; "
+                "return the new value instead"
+            )
 
     def set(self, key: str, value: Any) -> None:
-        """Set value by key."""
-        with self._lock:
-            self._data[key] = value
+        """Set value by key.
+
+        Re-publishing the object already stored under ``key`` (a producer
+        setting the same state every tick) returns after one lock-free
+        read: the store would change nothing, and it can be ordered just
+        before any writer racing with it.
+        """
+        self._check_not_updating()
+        i = hash(key) & _STRIPE_MASK
+        if self._shards[i].get(key, _MISSING) is value:
+            return
+        with self._locks[i]:
+            shard = self._shards[i].copy()
+            shard[key] = value
+            self._shards[i] = shard
 
     def update(self, key: str, func: Callable[[Any], Any]) -> Any:
         """Atomically update a value using a function.
 
+        ``func`` runs under the lock of ``key``'s stripe: it may read any
+        key, but writing to this SharedState from inside it (``set``,
+        ``update``, ...) raises :class:`RuntimeError` -- return the new
+        value instead.
+
         Args:
             key: Key to update
             func: Function that takes old value and returns new value
@@ -169,33 +222,185 @@ class SharedState:
         Example:
             state.update("count", lambda x: (x or 0) + 1)
         """
-        with self._lock:
-            old = self._data.get(key)
-            new = func(old)
-            self._data[key] = new
+        self._check_not_updating()
+        i = hash(key) & _STRIPE_MASK
+        updating = self._updating
+        with self._locks[i]:
+            updating.active = True
+            try:
+                new = func(self._shards[i].get(key))
+            finally:
+                updating.active = False
+            shard = self._shards[i].copy()
+            shard[key] = new
+            self._shards[i] = shard
             return new
 
+    def compare_and_set(self, key: str, expected: Any, new: Any) -> bool:
+        """Set ``key`` to ``new`` only if it currently *is* ``expected``.
+
+        The comparison is by identity, like :meth:`set`'s unchanged-value
+        check: ``1``, ``1.0`` and ``True`` are different values here, and
+        a value replaced by an equal copy counts as changed. Pass the
+        object :meth:`get` returned. A missing key compares as ``None``
+        (as in :meth:`update`). Returns True if the value was replaced.
+        Lets callers pair the lock-free :meth:`get` with a conditional
+        write instead of holding the lock across their own
+        read-compute-write:
+
+            while True:
+                old = state.get("count")
+                if state.compare_and_set("count", old, (old or 0) + 1):
+                    break
+        """
+        self._check_not_updating()
+        i = hash(key) & _STRIPE_MASK
+        with self._locks[i]:
+            if self._shards[i].get(key) is not expected:
+                return False
+            shard = self._shards[i].copy()
+            shard[key] = new
+            self._shards[i] = shard
+            return True
+
     def delete(self, key: str) -> bool:
         """Delete a key. Returns True if key existed."""
-        with self._lock:
-            if key in self._data:
-                del self._data[key]
-                return True
-            return False
+        self._check_not_updating()
+        i = hash(key) & _STRIPE_MASK
+        with self._locks[i]:
+            if key not in self._shards[i]:
+                return False
+            shard = self._shards[i].copy()
+            del shard[key]
+            self._shards[i] = shard
+            return True
 
     def clear(self) -> None:
         """Clear all data."""
-        with self._lock:
-            self._data.clear()
+        self._check_not_updating()
+        for i, lock in enumerate(self._locks):
+            with lock:
+                self._shards[i] = {}
+
+    def items(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Get a copy of all items, or only of ``keys`` when given.
+
+        Observers that only care about a few entries should pass ``keys``:
+        the snapshot is then built from just those entries instead of
+        copying every stripe. Missing keys are skipped.
+
+        Lock-free like :meth:`get`: each stripe is read from its published
+        snapshot, so the result is consistent per stripe but may interleave
+        with writers across stripes. Keys come back grouped by stripe, not
+        in insertion order.
+        """
+        if keys is None:
+            data: Dict[str, Any] = {}
+            for shard in self._shards:
+                data.update(shard)
+            return data
+        result: Dict[str, Any] = {}
+        shards = self._shards
+        for k in keys:
+            value = shards[hash(k) & _STRIPE_MASK].get(k, _MISSING)
+            if value is not _MISSING:
+                result[k] = value
+        return result
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._shards[hash(key) & _STRIPE_MASK]
 
-    def items(self) -> Dict[str, Any]:
-        """Get a copy of all items."""
+
+class ShardedCounter:
+    """Integer counter that scales with many concurrent writer threads.
+
+    Each thread adds into its own slot, so :meth:`add` never contends on
+    a shared lock (the lock is taken once per thread, to register its
+    slot, and once more when the thread exits, to fold the slot into a
+    base total); :meth:`get` sums the base and the live slots. Use it for
+    hot, write-mostly tallies -- events seen, bytes processed -- and
+    :meth:`SharedState.update` where a read-modify-write must act on the
+    latest total.
+
+    Example:
+        processed = ShardedCounter()
+        processed.add()      # from any number of threads
+        processed.add(10)
+        processed.get()      # 11
+    """
+
+    def __init__(self, initial: int = 0) -> None:
+        # Counts of threads that have exited, plus ``initial``.
+        self._base = initial
+        self._local = threading.local()
+        # Live threads' slots, keyed by id(slot); each is a one-element list
+        # only its owner mutates. A slot is folded into ``_base`` and dropped
+        # when its thread's locals are cleared, so thread-per-request
+        # workloads don't grow this without bound.
+        self._slots: Dict[int, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, delta: int = 1) -> None:
+        """Add ``delta`` to this thread's slot."""
+        slot: Optional[List[int]] = getattr(self._local, "slot", None)
+        if slot is None:
+            slot = [0]
+            owner = _SlotOwner()
+            self._local.slot, self._local.owner = slot, owner
+            with self._lock:
+                self._slots[id(slot)] = slot
+            weakref.finalize(owner, ShardedCounter._retire, weakref.ref(self), slot)
+        slot[0] += delta
+
+    def get(self) -> int:
+        """Current total across all threads' slots."""
         with self._lock:
-            return self._data.copy()
+            return self._base + sum(slot[0] for slot in self._slots.values())
 
-    def __contains__(self, key: str) -> bool:
+    @staticmethod
+    def _retire(ref: weakref.ref[ShardedCounter], slot: List[int]) -> None:
+        # Runs once the slot's thread has exited; holds only a weak reference
+        # so live threads don't keep a discarded counter alive.
+        counter = ref()
+        if counter is None:
+            return
+        with counter._lock:
+            counter._base += slot[0]
+            del counter._slots[id(slot)]
+
+
+class _SlotOwner:
+    """Thread-local marker whose collection retires a ShardedCounter slot."""
+
+
+class AtomicInt:
+    """Integer whose read-modify-write is a single lock-protected step.
+
+    Where :class:`ShardedCounter` only needs an eventual total,
+    :meth:`add` hands back the post-increment value, so callers can hand
+    out sequence numbers or react to crossing a threshold. That is one
+    lock trip instead of a ``get`` + ``set`` pair on :class:`SharedState`,
+    with no lost updates between the two.
+
+    Example:
+        seq = AtomicInt()
+        seq.add()      # 1, unique across threads
+        seq.add(-1)    # 0
+    """
+
+    def __init__(self, value: int = 0) -> None:
+        self._value = value
+        self._lock = threading.Lock()
+
+    def add(self, delta: int = 1) -> int:
+        """Add ``delta`` and return the new value."""
         with self._lock:
-            return key in self._data
+            self._value += delta
+            return self._value
+
+    def get(self) -> int:
+        """Current value (plain read; the reference load needs no lock)."""
+        return self._value
 
 
 @dataclass
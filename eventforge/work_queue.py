@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import math
 import threading
 import time
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+
+# ``Callable`` is subscripted at runtime in the _Consumer alias below; the
+# typing alias is required on Python 3.8 (collections.abc generics are 3.9+).
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
 from eventforge.queue import MessageQueue
 from eventforge.transports.base import Transport
 from eventforge.types import Message
 
+# (message, delivery_id) pair handed to a push-consumer.
+_Delivery = Tuple[Message, str]
+# (consumer_id, handler) registered under a consumer group.
+_Consumer = Tuple[str, Callable[[Message], None]]
+
 
 class QueueFullError(Exception):
     """Raised when enqueue is called on a full work queue."""
@@ -30,7 +40,7 @@ class InFlightEntry:
     delivery_id: str
     topic: str
     consumer_group: str
-    delivered_at: float
+    delivered_at: float  # math.inf until a push handler starts on it
     visibility_timeout: float
     retry_count: int
 
@@ -55,6 +65,14 @@ class WorkQueue(MessageQueue):
         default_visibility_timeout: Seconds before unack'd message is redelivered
         max_retries: Max delivery attempts before dead-lettering
         reaper_interval: Seconds between visibility timeout sweeps
+        max_handler_workers: Size of the thread pool that runs push-consumer
+            handlers (None = ThreadPoolExecutor's default)
+        inline_threshold: Dispatch batches of at most this many deliveries
+            run inline on the calling thread instead of the pool (0 = never)
+        handler_pool: Caller-owned pool to run push-consumer handlers on,
+            e.g. one shared by several queues so their handler threads stay
+            bounded in total. It is left running on :meth:`close`;
+            ``max_handler_workers`` is ignored when it is given.
     """
 
     def __init__(
@@ -64,6 +82,9 @@ class WorkQueue(MessageQueue):
         default_visibility_timeout: float = 30.0,
         max_retries: int = 3,
         reaper_interval: float = 1.0,
+        max_handler_workers: Optional[int] = None,
+        inline_threshold: int = 0,
+        handler_pool: Optional[ThreadPoolExecutor] = None,
     ):
         super().__init__(transport=transport)
         self._max_work_queue_size = max_work_queue_size
@@ -71,7 +92,10 @@ class WorkQueue(MessageQueue):
         self._max_retries = max_retries
         self._reaper_interval = reaper_interval
 
-        self._wq_lock = threading.RLock()
+        # A plain (C-level) lock, not an RLock: no code path re-enters it --
+        # handlers always run after it is released -- so the owner/count
+        # bookkeeping is pure overhead on every queue operation.
+        self._wq_lock = threading.Lock()
         self._pending: Dict[str, deque[Message]] = defaultdict(deque)
         self._in_flight: Dict[str, InFlightEntry] = {}
         # Each entry keeps the consumer_id alongside its handler so
@@ -82,11 +106,37 @@ class WorkQueue(MessageQueue):
         ] = defaultdict(list)
         self._rr_index: Dict[Tuple[str, str], int] = defaultdict(int)
         self._consumer_registry: Dict[str, Tuple[str, str]] = {}
-        self._pending_condition = threading.Condition(self._wq_lock)
+        # One condition per topic, all over ``_wq_lock``: an enqueue wakes
+        # exactly as many dequeue() waiters as it added messages, and only
+        # waiters on that topic, instead of a notify_all() herd across every
+        # topic that mostly goes straight back to sleep. Entries live only
+        # while the topic has waiters (counted in ``_pending_waiters``), so
+        # dynamic topic names do not accumulate conditions.
+        self._pending_conditions: Dict[str, threading.Condition] = {}
+        self._pending_waiters: Dict[str, int] = {}
         self._closed_wq = False
+        # Topics with a drain in progress, and those that received new work
+        # while it ran. A burst of enqueues on one topic collapses into the
+        # running drain's next pass instead of one drain per enqueue.
+        self._dispatching: Set[str] = set()
+        self._redispatch: Set[str] = set()
 
         self._reaper_running = False
         self._reaper_thread: Optional[threading.Thread] = None
+        # Set once by close(); the reaper sleeps on it between sweeps, so
+        # close() wakes it at once instead of joining through up to a full
+        # reaper_interval of time.sleep().
+        self._reaper_stop = threading.Event()
+
+        # Push-consumer handlers run on one long-lived pool (created on first
+        # dispatch) rather than a fresh Thread per delivered message.
+        self._max_handler_workers = max_handler_workers
+        self._handler_pool: Optional[ThreadPoolExecutor] = handler_pool
+        self._owns_handler_pool = handler_pool is None
+        # Tiny dispatch batches (typically one message to one consumer) are
+        # cheaper to run inline than to hand off to the pool; public so it
+        # can be tuned on a live queue.
+        self.inline_threshold = inline_threshold
 
     def enqueue(
         self,
@@ -109,37 +159,86 @@ class WorkQueue(MessageQueue):
         Raises:
             QueueFullError: If max_work_queue_size > 0 and queue is full
         """
+        return self._enqueue_batch(topic, [payload], visibility_timeout, headers)[0]
+
+    def enqueue_many(
+        self,
+        topic: str,
+        payloads: Iterable[Any],
+        visibility_timeout: Optional[float] = None,
+        **headers: Any,
+    ) -> List[str]:
+        """Put several messages on the work queue for ``topic`` at once.
+
+        Same message shape as :meth:`enqueue`, but the batch is appended
+        under one lock acquisition, wakes waiters once, and triggers a
+        single dispatch pass -- instead of one of each per message.
+        All-or-nothing: if the batch doesn't fit, nothing is enqueued.
+
+        Args:
+            topic: Destination topic
+            payloads: Message payloads, enqueued in order
+            visibility_timeout: Per-message visibility timeout override
+            **headers: Additional headers applied to every message
+
+        Returns:
+            message_ids (List[str]) in payload order
+
+        Raises:
+            QueueFullError: If max_work_queue_size > 0 and the batch doesn't fit
+        """
+        return self._enqueue_batch(topic, payloads, visibility_timeout, headers)
+
+    def _enqueue_batch(
+        self,
+        topic: str,
+        payloads: Iterable[Any],
+        visibility_timeout: Optional[float],
+        headers: Dict[str, Any],
+    ) -> List[str]:
+        """Shared body of :meth:`enqueue` / :meth:`enqueue_many`.
+
+        Takes ``headers`` as a plain dict so user headers can never collide
+        with either public method's own parameter names.
+        """
         vt = (
             visibility_timeout
             if visibility_timeout is not None
             else self._default_visibility_timeout
         )
-        message = Message(
-            topic=topic,
-            payload=payload,
-            headers={
-                "_wq_retry_count": 0,
-                "_wq_original_topic": topic,
-                "_wq_enqueued_at": datetime.now(timezone.utc).isoformat(),
-                "_wq_visibility_timeout": vt,
-                **headers,
-            },
-        )
+        enqueued_at = datetime.now(timezone.utc).isoformat()
+        messages = [
+            Message(
+                topic=topic,
+                payload=payload,
+                headers={
+                    "_wq_retry_count": 0,
+                    "_wq_original_topic": topic,
+                    "_wq_enqueued_at": enqueued_at,
+                    "_wq_visibility_timeout": vt,
+                    **headers,
+                },
+            )
+            for payload in payloads
+        ]
+        if not messages:
+            return []
 
         with self._wq_lock:
+            pending = self._pending[topic]
             if (
                 self._max_work_queue_size > 0
-                and len(self._pending[topic]) >= self._max_work_queue_size
+                and len(pending) + len(messages) > self._max_work_queue_size
             ):
                 raise QueueFullError(
                     f"Work queue for topic '{topic}' is full "
                     f"({self._max_work_queue_size} messages)"
                 )
-            self._pending[topic].append(message)
-            self._pending_condition.notify_all()
+            pending.extend(messages)
+            self._notify_pending(topic, len(messages))
 
         self._try_dispatch(topic)
-        return message.id
+        return [message.id for message in messages]
 
     def consume(
         self,
@@ -193,22 +292,23 @@ class WorkQueue(MessageQueue):
         if timeout is not None:
             deadline = time.monotonic() + timeout
 
-        with self._pending_condition:
+        with self._wq_lock:
             while True:
                 if self._closed_wq:
                     return None
 
-                if self._pending[topic]:
-                    msg = self._pending[topic].popleft()
+                # .get(): polling an idle topic must not add it to _pending.
+                pending = self._pending.get(topic)
+                if pending:
+                    msg = pending.popleft()
                     return self._make_in_flight(msg, topic, f"{topic}._pull")
 
+                wait_timeout = 1.0
                 if deadline is not None:
-                    remaining = deadline - time.monotonic()
-                    if remaining <= 0:
+                    wait_timeout = deadline - time.monotonic()
+                    if wait_timeout <= 0:
                         return None
-                    self._pending_condition.wait(timeout=remaining)
-                else:
-                    self._pending_condition.wait(timeout=1.0)
+                self._wait_pending(topic, wait_timeout)
 
     def ack(self, delivery_id: str) -> bool:
         """Acknowledge successful processing of a message.
@@ -221,10 +321,7 @@ class WorkQueue(MessageQueue):
             False if delivery_id not found (already ack'd, expired, etc.)
         """
         with self._wq_lock:
-            if delivery_id in self._in_flight:
-                del self._in_flight[delivery_id]
-                return True
-            return False
+            return self._in_flight.pop(delivery_id, None) is not None
 
     def nack(
         self,
@@ -242,32 +339,31 @@ class WorkQueue(MessageQueue):
             True if the message was in-flight and is now nack'd,
             False if delivery_id not found
         """
-        dispatch_topic = None
         with self._wq_lock:
             entry = self._in_flight.pop(delivery_id, None)
-            if entry is None:
-                return False
+        if entry is None:
+            return False
 
-            new_retry = entry.retry_count + 1
-            if requeue and new_retry < self._max_retries:
-                new_headers = {
-                    **entry.message.headers,
-                    "_wq_retry_count": new_retry,
-                }
-                requeued = entry.message.model_copy(update={"headers": new_headers})
+        # Build the requeued / dead-lettered copy outside the lock: the
+        # pydantic copy only touches the popped entry, so only the append
+        # below needs to serialize against other queue operations.
+        new_retry = entry.retry_count + 1
+        if requeue and new_retry < self._max_retries:
+            requeued = self._retry_copy(entry, new_retry)
+            with self._wq_lock:
                 self._pending[entry.topic].appendleft(requeued)
-                self._pending_condition.notify_all()
-                dispatch_topic = entry.topic
-            else:
-                reason = (
-                    "max_retries_exceeded"
-                    if new_retry >= self._max_retries
-                    else "nack_no_requeue"
-                )
-                self._dead_letter(entry.message, entry.topic, reason)
-
-        if dispatch_topic is not None:
-            self._try_dispatch(dispatch_topic)
+                self._notify_pending(entry.topic, 1)
+            self._try_dispatch(entry.topic)
+        else:
+            reason = (
+                "max_retries_exceeded"
+                if new_retry >= self._max_retries
+                else "nack_no_requeue"
+            )
+            dl_msg = self._dead_letter_copy(entry.message, entry.topic, reason)
+            with self._wq_lock:
+                self._pending[dl_msg.topic].append(dl_msg)
+                self._notify_pending(dl_msg.topic, 1)
 
         return True
 
@@ -311,6 +407,7 @@ class WorkQueue(MessageQueue):
         """Stop reaper thread and close transport."""
         self._reaper_running = False
         self._closed_wq = True
+        self._reaper_stop.set()
         if self._reaper_thread is not None:
             self._reaper_thread.join(timeout=5.0)
             self._reaper_thread = None
@@ -319,13 +416,30 @@ class WorkQueue(MessageQueue):
             self._in_flight.clear()
             self._consumer_groups.clear()
             self._consumer_registry.clear()
-            self._pending_condition.notify_all()
+            for condition in self._pending_conditions.values():
+                condition.notify_all()
+            pool = self._handler_pool
+            self._handler_pool = None
+        if pool is not None and self._owns_handler_pool:
+            pool.shutdown(wait=False)
         super().close()
 
     # --- Internal helpers ---
 
     def _make_in_flight(self, msg: Message, topic: str, consumer_group: str) -> Message:
         """Stamp a message with a delivery_id, record it in-flight, and return it."""
+        delivered, entry = self._stamp_delivery(msg, topic, consumer_group)
+        self._in_flight[entry.delivery_id] = entry
+        self._start_reaper_if_needed()
+        return delivered
+
+    def _stamp_delivery(
+        self, msg: Message, topic: str, consumer_group: str
+    ) -> Tuple[Message, InFlightEntry]:
+        """Build the delivered copy of ``msg`` and its in-flight record.
+
+        Touches no shared state, so it can run without ``_wq_lock``.
+        """
         delivery_id = str(uuid4())
         vt = msg.headers.get("_wq_visibility_timeout", self._default_visibility_timeout)
         retry_count = msg.headers.get("_wq_retry_count", 0)
@@ -342,84 +456,199 @@ class WorkQueue(MessageQueue):
             visibility_timeout=vt,
             retry_count=retry_count,
         )
-        self._in_flight[delivery_id] = entry
-        self._start_reaper_if_needed()
-        return delivered
+        return delivered, entry
+
+    def _wait_pending(self, topic: str, timeout: float) -> None:
+        """Wait up to ``timeout`` seconds for work on ``topic``.
+
+        Must be called with ``_wq_lock`` held. The topic's condition is
+        created for the first waiter and dropped when the last one leaves.
+        """
+        condition = self._pending_conditions.get(topic)
+        if condition is None:
+            condition = threading.Condition(self._wq_lock)
+            self._pending_conditions[topic] = condition
+        self._pending_waiters[topic] = self._pending_waiters.get(topic, 0) + 1
+        try:
+            condition.wait(timeout=timeout)
+        finally:
+            waiters = self._pending_waiters[topic] - 1
+            if waiters:
+                self._pending_waiters[topic] = waiters
+            else:
+                del self._pending_waiters[topic]
+                del self._pending_conditions[topic]
+
+    def _notify_pending(self, topic: str, count: int) -> None:
+        """Wake up to ``count`` dequeue() waiters on ``topic``.
+
+        Must be called with ``_wq_lock`` held.
+        """
+        condition = self._pending_conditions.get(topic)
+        if condition is not None:
+            condition.notify(count)
 
     def _try_dispatch(self, topic: str) -> None:
-        """Try to dispatch pending messages to push-consumers for a topic."""
-        to_invoke: List[Tuple[Callable[[Message], None], Message, str]] = []
+        """Try to dispatch pending messages to push-consumers for a topic.
 
+        Coalesced per topic: if another call is already draining ``topic``,
+        this one only flags it for another pass and returns.
+        """
         with self._wq_lock:
-            groups = [key for key in self._consumer_groups if key[0] == topic]
-            if not groups:
+            if topic in self._dispatching:
+                self._redispatch.add(topic)
                 return
+            self._dispatching.add(topic)
+        try:
+            while True:
+                self._drain_to_consumers(topic)
+                with self._wq_lock:
+                    if topic not in self._redispatch:
+                        self._dispatching.discard(topic)
+                        return
+                    self._redispatch.discard(topic)
+        except BaseException:
+            with self._wq_lock:
+                self._dispatching.discard(topic)
+                self._redispatch.discard(topic)
+            raise
 
-            while self._pending[topic]:
-                msg = self._pending[topic].popleft()
-                dispatched = False
+    def _drain_to_consumers(self, topic: str) -> None:
+        """Hand every pending message on ``topic`` to its push-consumers."""
+        to_invoke: List[Tuple[str, Callable[[Message], None], Message, str]] = []
 
-                for key in groups:
-                    entries = self._consumer_groups.get(key)
-                    if not entries:
-                        continue
+        # Swap-and-drain: one lock trip takes the whole backlog and reserves
+        # its round-robin slots; the per-message copies are then built
+        # outside the lock, and a second trip records them in-flight.
+        with self._wq_lock:
+            pending = self._pending[topic]
+            if not pending:
+                return
+            # (consumer_group, handler entries, first round-robin index)
+            routes: List[Tuple[str, List[_Consumer], int]] = []
+            for key, entries in self._consumer_groups.items():
+                if key[0] != topic or not entries:
+                    continue
+                start = self._rr_index[key]
+                self._rr_index[key] = (start + len(pending)) % len(entries)
+                routes.append((key[1], list(entries), start))
+            if not routes:
+                return
+            self._pending[topic] = deque()
+
+        fan_out = len(routes) > 1
+        in_flight: Dict[str, InFlightEntry] = {}
+        for n, msg in enumerate(pending):
+            for group, entries, start in routes:
+                msg_copy = (
+                    msg.model_copy(update={"id": str(uuid4())}) if fan_out else msg
+                )
+                delivered, record = self._stamp_delivery(msg_copy, topic, group)
+                # A consumer works through its share one message at a time,
+                # so the visibility clock starts in _invoke_handler, not
+                # while the message waits behind earlier ones.
+                record.delivered_at = math.inf
+                in_flight[record.delivery_id] = record
+                consumer_id, handler = entries[(start + n) % len(entries)]
+                to_invoke.append((consumer_id, handler, delivered, record.delivery_id))
 
-                    if len(groups) > 1:
-                        msg_copy = msg.model_copy(update={"id": str(uuid4())})
-                    else:
-                        msg_copy = msg
+        with self._wq_lock:
+            if self._closed_wq:
+                return
+            self._in_flight.update(in_flight)
+            self._start_reaper_if_needed()
 
-                    delivered = self._make_in_flight(msg_copy, topic, key[1])
-                    idx = self._rr_index[key] % len(entries)
-                    _consumer_id, handler = entries[idx]
-                    self._rr_index[key] = idx + 1
-                    dispatched = True
+        # Call handlers outside lock to avoid deadlocks
+        if len(to_invoke) <= self.inline_threshold:
+            for _consumer_id, handler, delivered, delivery_id in to_invoke:
+                self._invoke_handler(handler, delivered, delivery_id)
+            return
 
-                    delivery_id = delivered.headers["_wq_delivery_id"]
-                    to_invoke.append((handler, delivered, delivery_id))
+        pool = self._get_handler_pool()
+        if pool is None:
+            return
+        # One pool task per consumer rather than per message: a drained burst
+        # costs O(consumers) submits, and each consumer works through its
+        # share in delivery order. Keyed by consumer id, not handler, so
+        # several workers registered with the same function stay separate.
+        batches: Dict[str, Tuple[Callable[[Message], None], List[_Delivery]]] = {}
+        for consumer_id, handler, delivered, delivery_id in to_invoke:
+            entry = batches.get(consumer_id)
+            if entry is None:
+                batches[consumer_id] = (handler, [(delivered, delivery_id)])
+            else:
+                entry[1].append((delivered, delivery_id))
+        for handler, batch in batches.values():
+            pool.submit(self._invoke_batch, handler, batch)
 
-                if not dispatched:
-                    self._pending[topic].appendleft(msg)
-                    break
+    def _get_handler_pool(self) -> Optional[ThreadPoolExecutor]:
+        """Return the push-consumer pool, creating it on first use.
 
-        # Call handlers outside lock to avoid deadlocks
-        for handler, delivered, delivery_id in to_invoke:
-            threading.Thread(
-                target=self._invoke_handler,
-                args=(handler, delivered, delivery_id),
-                daemon=True,
-            ).start()
+        Returns None once the queue is closed so a dispatch racing with
+        :meth:`close` cannot resurrect a pool nobody will shut down.
+        """
+        with self._wq_lock:
+            if self._closed_wq:
+                return None
+            if self._handler_pool is None:
+                self._handler_pool = ThreadPoolExecutor(
+                    max_workers=self._max_handler_workers,
+                    thread_name_prefix="eventforge-wq",
+                )
+            return self._handler_pool
+
+    def _invoke_batch(
+        self, handler: Callable[[Message], None], batch: List[_Delivery]
+    ) -> None:
+        """Invoke ``handler`` on each delivery of a dispatch batch in turn."""
+        for message, delivery_id in batch:
+            self._invoke_handler(handler, message, delivery_id)
 
     def _invoke_handler(
         self, handler: Callable[[Message], None], message: Message, delivery_id: str
     ) -> None:
-        """Invoke a push-consumer handler, auto-nacking on exception."""
+        """Invoke a push-consumer handler, auto-nacking on exception.
+
+        Starts the delivery's visibility-timeout clock first.
+        """
+        with self._wq_lock:
+            entry = self._in_flight.get(delivery_id)
+            if entry is not None:
+                entry.delivered_at = time.monotonic()
         try:
             handler(message)
         except Exception:
             self.nack(delivery_id, requeue=True)
 
-    def _dead_letter(self, message: Message, topic: str, reason: str) -> None:
-        """Send a message to the dead-letter topic.
+    @staticmethod
+    def _retry_copy(entry: InFlightEntry, retry_count: int) -> Message:
+        """Copy of an in-flight message stamped for redelivery.
 
-        Must be called while holding self._wq_lock.
+        Pure -- call it without holding self._wq_lock.
+        """
+        new_headers = {**entry.message.headers, "_wq_retry_count": retry_count}
+        return entry.message.model_copy(update={"headers": new_headers})
+
+    @staticmethod
+    def _dead_letter_copy(message: Message, topic: str, reason: str) -> Message:
+        """Copy of a message addressed to ``topic``'s dead-letter topic.
+
+        Pure -- call it without holding self._wq_lock, then append the
+        result to ``self._pending[result.topic]`` under the lock.
         """
-        dl_topic = f"{topic}.dead_letter"
         new_headers = {
             **message.headers,
             "_wq_dead_lettered_at": datetime.now(timezone.utc).isoformat(),
             "_wq_dead_letter_reason": reason,
             "_wq_original_topic": message.headers.get("_wq_original_topic", topic),
         }
-        dl_msg = message.model_copy(
+        return message.model_copy(
             update={
-                "topic": dl_topic,
+                "topic": f"{topic}.dead_letter",
                 "headers": new_headers,
                 "id": str(uuid4()),
             }
         )
-        self._pending[dl_topic].append(dl_msg)
-        self._pending_condition.notify_all()
 
     def _start_reaper_if_needed(self) -> None:
         """Lazily start the visibility timeout reaper thread."""
@@ -442,27 +671,33 @@ class WorkQueue(MessageQueue):
                         expired.append(entry)
                         del self._in_flight[delivery_id]
 
+            if expired:
+                # Copies are built outside the lock (see nack()); only the
+                # appends are serialized.
+                retried: List[Tuple[str, Message]] = []
+                dead: List[Message] = []
                 for entry in expired:
                     new_retry = entry.retry_count + 1
                     if new_retry < self._max_retries:
-                        new_headers = {
-                            **entry.message.headers,
-                            "_wq_retry_count": new_retry,
-                        }
-                        requeued = entry.message.model_copy(
-                            update={"headers": new_headers}
+                        retried.append(
+                            (entry.topic, self._retry_copy(entry, new_retry))
                         )
-                        self._pending[entry.topic].appendleft(requeued)
                         requeued_topics.add(entry.topic)
                     else:
-                        self._dead_letter(
-                            entry.message,
-                            entry.topic,
-                            "visibility_timeout_exceeded",
+                        dead.append(
+                            self._dead_letter_copy(
+                                entry.message,
+                                entry.topic,
+                                "visibility_timeout_exceeded",
+                            )
                         )
-
-                if expired:
-                    self._pending_condition.notify_all()
+                with self._wq_lock:
+                    for topic, requeued in retried:
+                        self._pending[topic].appendleft(requeued)
+                        self._notify_pending(topic, 1)
+                    for dl_msg in dead:
+                        self._pending[dl_msg.topic].append(dl_msg)
+                        self._notify_pending(dl_msg.topic, 1)
 
             # Outside the lock: hand timed-out-and-requeued messages back to
             # push-consumers too, not just pull-side dequeue() waiters --
@@ -471,4 +706,5 @@ class WorkQueue(MessageQueue):
             for topic in requeued_topics:
                 self._try_dispatch(topic)
 
-            time.sleep(self._reaper_interval)
+            if self._reaper_stop.wait(self._reaper_interval):
+                return
@@ -1,5 +1,6 @@
 """Tests for eventforge.executor module."""
 
+import multiprocessing
 import time
 
 import pytest
@@ -72,6 +73,14 @@ class TestExecutorSequential:
             assert result.is_success is False
             assert result.is_failure is True
 
+    def test_submit_detached_runs_inline(self):
+        executor = Executor()
+        seen = []
+        executor.submit_detached(seen.append, 1)
+        executor.submit_detached(failing_task)  # logged, not raised
+        assert seen == [1]
+        assert executor._results == {}
+
 
 class TestExecutorThread:
     def test_concurrent_execution(self):
@@ -94,6 +103,13 @@ class TestExecutorThread:
             with pytest.raises(TimeoutError):
                 executor.result(task_id, timeout=0.1)
 
+    def test_result_for_unknown_task_times_out(self):
+        with Executor(mode=ExecutionMode.THREAD) as executor:
+            start = time.monotonic()
+            with pytest.raises(TimeoutError, match="not found"):
+                executor.result("no-such-task", timeout=0.1)
+            assert 0.09 <= time.monotonic() - start < 1.0
+
     def test_thread_map(self):
         with Executor(mode=ExecutionMode.THREAD, max_workers=4) as executor:
             results = executor.map(lambda x: x * 2, [1, 2, 3, 4])
@@ -101,6 +117,24 @@ class TestExecutorThread:
             values = [r.value for r in results]
             assert values == [2, 4, 6, 8]
 
+    def test_map_timeout_bounds_the_whole_call(self):
+        with Executor(mode=ExecutionMode.THREAD, max_workers=2) as executor:
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                executor.map(slow_task, [1.0, 1.0], timeout=0.3)
+            assert time.monotonic() - start < 0.5
+
+    def test_submit_detached_runs_on_pool_without_result(self, caplog):
+        executor = Executor(mode=ExecutionMode.THREAD, max_workers=2)
+        seen = []
+        executor.submit_detached(seen.append, 1)
+        executor.submit_detached(failing_task)
+        executor.stop(wait=True)
+
+        assert seen == [1]
+        assert executor._results == {}
+        assert "detached task failed" in caplog.text
+
 
 class TestExecutorProcess:
     def test_process_execution(self):
@@ -120,6 +154,31 @@ class TestExecutorProcess:
             assert results[1].value == sum(range(200))
             assert results[2].value == sum(range(300))
 
+    def test_process_failure(self):
+        with Executor(mode=ExecutionMode.PROCESS, max_workers=1) as executor:
+            result = executor.result(executor.submit(failing_task), timeout=10.0)
+
+            assert result.status == TaskStatus.FAILED
+            assert result.error_type == "ValueError"
+            assert result.worker_id.startswith("process-")
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="fork start method unavailable",
+    )
+    def test_process_mp_context(self):
+        with Executor(
+            mode=ExecutionMode.PROCESS, max_workers=2, mp_context="fork"
+        ) as executor:
+            result = executor.result(executor.submit(compute_sum, 100), timeout=10.0)
+
+            assert result.status == TaskStatus.COMPLETED
+            assert result.value == sum(range(100))
+
+    def test_unknown_mp_context_raises(self):
+        with pytest.raises(ValueError):
+            Executor(mode=ExecutionMode.PROCESS, mp_context="bogus")
+
 
 class TestExecutorContextManager:
     def test_context_manager_starts_and_stops(self):
@@ -131,6 +190,15 @@ class TestExecutorContextManager:
 
         assert executor._running is False
 
+    def test_mode_accepts_string_value(self):
+        with Executor(mode="thread", max_workers=2) as executor:
+            assert executor.mode is ExecutionMode.THREAD
+            result = executor.result(executor.submit(compute_sum, 10), timeout=5.0)
+            assert result.value == sum(range(10))
+
+        with pytest.raises(ValueError):
+            Executor(mode="bogus")
+
     def test_mode_property(self):
         executor = Executor(mode=ExecutionMode.PROCESS)
         assert executor.mode == ExecutionMode.PROCESS
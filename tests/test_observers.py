@@ -11,9 +11,11 @@ import pytest
 from eventforge import (
     BroadcastDispatcher,
     ConcurrentDispatcher,
+    Dispatcher,
     Eventful,
     ExecutionContext,
     LeastLoadedDispatcher,
+    MemoryMeter,
     Meter,
     MetricsMeter,
     Node,
@@ -46,6 +48,16 @@ class TestEventful:
         assert a == ["hello"]
         assert b == ["hello"]
 
+    def test_fire_forwards_any_argument_shape(self):
+        e = Eventful()
+        calls = []
+        e.on(lambda *a, **kw: calls.append((a, kw)))
+        e.fire(1)
+        e.fire(1, 2)
+        e.fire(x=3)
+        e.fire()
+        assert calls == [((1,), {}), ((1, 2), {}), ((), {"x": 3}), ((), {})]
+
     def test_unsubscribe(self):
         e = Eventful()
         results = []
@@ -55,6 +67,20 @@ class TestEventful:
         e.fire(2)
         assert results == [1]
 
+    def test_subscribe_during_fire_applies_to_next_fire(self):
+        e = Eventful()
+        late = []
+
+        def first(x):
+            e.on(lambda y: late.append(y))
+
+        e.on(first)
+        e.fire(1)
+        assert late == []
+        e.unsubscribe(first)
+        e.fire(2)
+        assert late == [2]
+
     def test_failing_subscriber_propagates(self):
         e = Eventful()
         ok = []
@@ -129,6 +155,19 @@ class TestObservable:
         obj = _DemoObservable()
         assert set(obj.events()) == {"alpha", "beta"}
 
+    def test_events_includes_class_level_and_property_channels(self):
+        class _Mixed(_DemoObservable):
+            shared = Eventful()
+
+            @property
+            def derived(self):
+                return self.alpha
+
+            def helper(self):
+                return None
+
+        assert _Mixed().events() == ["alpha", "beta", "derived", "shared"]
+
 
 # =============================================================================
 # Dispatchers
@@ -145,6 +184,31 @@ class TestDispatchers:
         )
         assert seen == [("a", 5), ("b", 5)]
 
+    def test_custom_dispatcher_runs_without_local_subscribers(self):
+        forwarded = []
+
+        class Forwarding(Dispatcher):
+            def dispatch(self, subscribers, args, kwargs):
+                forwarded.append((tuple(subscribers), args, kwargs))
+
+        ch = Eventful(dispatcher=Forwarding())
+        ch.fire(1, key="v")
+        assert forwarded == [((), (1,), {"key": "v"})]
+
+    def test_broadcast_subclass_dispatch_is_honoured(self):
+        class Reversed(BroadcastDispatcher):
+            def dispatch(self, subscribers, args, kwargs):
+                super().dispatch(list(reversed(subscribers)), args, kwargs)
+
+        seen = []
+        ch = Eventful()
+        ch.on(lambda: seen.append("a"))
+        ch.on(lambda: seen.append("b"))
+        ch.fire()
+        ch.set_dispatcher(Reversed())
+        ch.fire()
+        assert seen == ["a", "b", "b", "a"]
+
     def test_concurrent_uses_executor(self):
         with ThreadPoolExecutor(2) as pool:
             seen = []
@@ -159,6 +223,46 @@ class TestDispatchers:
             pool.shutdown(wait=True)
             assert seen == [1, 1]
 
+    def test_concurrent_adaptive_inlines_cheap_subscribers(self):
+        with ThreadPoolExecutor(2) as pool:
+            threads = []
+            d = ConcurrentDispatcher(pool, inline_threshold_ns=5_000_000)
+
+            def record():
+                threads.append(threading.current_thread())
+
+            for _ in range(3):
+                d.dispatch([record, record], (), {})
+            assert threads == [threading.current_thread()] * 6
+
+            def slow():
+                time.sleep(0.05)
+                threads.append(threading.current_thread())
+
+            d.dispatch([slow], (), {})  # inline, but pushes the estimate up
+            threads.clear()
+            d.dispatch([slow, slow], (), {})
+            pool.shutdown(wait=True)
+            assert len(threads) == 2
+            assert threading.current_thread() not in threads
+
+    def test_concurrent_inline_single_skips_pool_for_one_subscriber(self):
+        with ThreadPoolExecutor(2) as pool:
+            threads = []
+
+            def record():
+                threads.append(threading.current_thread())
+
+            d = ConcurrentDispatcher(pool, inline_single=True)
+            d.dispatch([record], (), {})
+            assert threads == [threading.current_thread()]
+
+            threads.clear()
+            d.dispatch([record, record], (), {})
+            pool.shutdown(wait=True)
+            assert len(threads) == 2
+            assert threading.current_thread() not in threads
+
     def test_least_loaded_picks_least_busy(self):
         class FakeNode:
             def __init__(self, load_val):
@@ -176,6 +280,25 @@ class TestDispatchers:
         assert n2.calls == 1
         assert n1.calls == n3.calls == 0
 
+    def test_least_loaded_reads_each_load_once_per_pick(self):
+        class CountingSub:
+            def __init__(self, load_val):
+                self.load_val = load_val
+                self.load_calls = 0
+                self.calls = 0
+
+            def load(self):
+                self.load_calls += 1
+                return self.load_val
+
+            def __call__(self, *a, **kw):
+                self.calls += 1
+
+        subs = [CountingSub(0.9), CountingSub(0.2), CountingSub(0.2)]
+        LeastLoadedDispatcher().dispatch(subs, (), {})
+        assert [s.load_calls for s in subs] == [1, 1, 1]
+        assert [s.calls for s in subs] == [0, 1, 0]  # ties keep list order
+
     def test_least_loaded_raises_when_all_saturated(self):
         class Sat:
             def load(self):
@@ -347,6 +470,57 @@ class TestMeter:
         m.update(7.0, n=2)
         assert seen == [("y", 7.0, 2)]
 
+    def test_sum_is_compensated(self):
+        m = Meter("t", reduction="sum")
+        for _ in range(10_000):
+            m.update(0.1)
+        assert m.value == 1000.0
+        m.update_many([0.1] * 10_000)
+        assert m.value == 2000.0
+
+    def test_sum_propagates_inf_and_overflow(self):
+        m = Meter("t", reduction="sum")
+        m.update(1.0)
+        m.update(float("inf"))
+        assert m.value == float("inf")
+        assert m.stats["value"] == float("inf")
+
+        overflow = Meter("o")
+        overflow.update(1e308)
+        overflow.update(1e308)
+        assert overflow.sum == float("inf")
+        assert overflow.value == float("inf")  # mean
+
+        batched = Meter("b", reduction="sum")
+        batched.update_many([1.0, float("inf")])
+        assert batched.value == float("inf")
+
+    def test_update_many_matches_repeated_update(self):
+        batched, single = Meter("b", reduction="min"), Meter("s", reduction="min")
+        seen = []
+        batched.update_event.on(lambda meter, val, n: seen.append((val, n)))
+        values = [3.0, 1.0, 5.0, 2.0]
+
+        batched.update_many(values)
+        for v in values:
+            single.update(v)
+
+        assert batched.stats == single.stats == {"value": 1.0, "count": 4.0}
+        assert (batched.sum, batched.max_val, batched.last) == (11.0, 5.0, 2.0)
+        assert seen == [(v, 1) for v in values]
+
+    @pytest.mark.parametrize("values", [[1e308, 1e308], [float("inf"), float("-inf")]])
+    def test_update_many_matches_update_when_fsum_raises(self, values):
+        batched, single = Meter("b", reduction="sum"), Meter("s", reduction="sum")
+        batched.update_many(values)
+        for v in values:
+            single.update(v)
+
+        def state(m):
+            return (repr(m.sum), m.count, m.max_val, m.min_val, m.last)
+
+        assert state(batched) == state(single)
+
     def test_measurement_fires_on_success(self):
         class _MyMeter(Meter):
             def measure(self, ctx):
@@ -411,6 +585,44 @@ class TestReporter:
         t.on_success(ctx)
         assert seen and seen[0][0] == "timing"
 
+    def test_reporter_created_after_fire_still_receives(self):
+        class _LateMeter(Meter):
+            pass
+
+        seen = []
+        m = _LateMeter(name="late")
+        m.measurement.fire(m, 1.0, None)  # resolves (empty) subscriber cache
+
+        class _LateReporter(Reporter):
+            @observe(_LateMeter, "measurement")
+            def on_late(self, meter, val, ctx):
+                seen.append(val)
+
+        _LateReporter()
+        m.measurement.fire(m, 2.0, None)
+        assert seen == [2.0]
+
+    def test_stacked_observe_subscribes_to_each_target(self):
+        class _A(Meter):
+            pass
+
+        class _B(Meter):
+            pass
+
+        seen = []
+
+        class _Both(Reporter):
+            @observe(_A, "measurement")
+            @observe(_B, "update_event")
+            def on_any(self, meter, *rest):
+                seen.append(meter.name)
+
+        _Both()
+        a = _A(name="a")
+        a.measurement.fire(a, 1.0, None)
+        _B(name="b").update(1.0)
+        assert seen == ["a", "b"]
+
 
 # =============================================================================
 # Concrete meters
@@ -437,3 +649,19 @@ class TestConcreteMeters:
         )
         m.on_success(ctx)
         assert m.stats["value"] == 0.42
+
+    def test_memory_meter_scopes_tracemalloc_to_the_call(self):
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already enabled by the test runner")
+        m = MemoryMeter()
+        ctx = ExecutionContext(func_name="t", args=(), kwargs={})
+        m.on_start(ctx)
+        assert tracemalloc.is_tracing()
+        _buf = [0] * 10_000
+        m.on_success(ctx)
+        m.on_complete(ctx)
+        assert not tracemalloc.is_tracing()
+        assert m.stats["count"] == 1
+        assert m.stats["value"] > 0
@@ -1,5 +1,7 @@
 """Tests for eventforge.rpc module."""
 
+import asyncio
+import threading
 import time
 
 import pytest
@@ -198,6 +200,36 @@ class TestRPC:
 
         server.stop()
 
+    def test_async_method(self):
+        queue = MessageQueue()
+        server = RPCServer(queue, service_name="coro")
+
+        @server.register()
+        async def delayed_double(x):
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        server.serve(blocking=False)
+        client = RPCClient(queue, service_name="coro", timeout=5.0)
+
+        assert client.call("delayed_double", 21) == 42
+        assert asyncio.run(client.call_async("delayed_double", 4)) == 8
+
+        server.stop()
+
+    def test_blocking_serve_returns_promptly_on_stop(self):
+        server = RPCServer(MessageQueue(), service_name="blocking")
+        serving = threading.Thread(target=server.serve, kwargs={"blocking": True})
+        serving.start()
+        time.sleep(0.05)
+
+        start = time.monotonic()
+        server.stop()
+        serving.join(timeout=5.0)
+
+        assert not serving.is_alive()
+        assert time.monotonic() - start < 0.5
+
     def test_server_context_manager(self):
         queue = MessageQueue()
         executor = Executor()
@@ -126,6 +126,30 @@ def test_with_retry_does_not_retry_non_matching_exception() -> None:
     assert client.attempts == 1
 
 
+def test_with_retry_accepts_list_and_single_class_retry_on() -> None:
+    """retry_on is normalized up front; a list no longer fails at except-time."""
+
+    class _FlakyClient:
+        def __init__(self) -> None:
+            self.attempts = 0
+
+        def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+            self.attempts += 1
+            if self.attempts == 1:
+                raise ConnectionError("flake")
+            return "ok"
+
+    for retry_on in ([ConnectionError], ConnectionError):
+        flaky = _FlakyClient()
+        resilient = with_retry(
+            flaky,  # type: ignore[arg-type]
+            backoff_initial=0.001,
+            retry_on=retry_on,
+        )
+        assert resilient.call("ping") == "ok"
+        assert flaky.attempts == 2
+
+
 # =============================================================================
 # Integration: RoundRobin + retry over real (in-memory) RPC server
 # =============================================================================
@@ -1,15 +1,22 @@
 """Tests for eventforge.task module."""
 
+import asyncio
+import functools
+import gc
+import logging
+import pickle
 import threading
 import time
 
 import pytest
 
 from eventforge import (
+    AtomicInt,
     ExecutionMode,
     Executor,
     MessageQueue,
     MetricsMeter,
+    ShardedCounter,
     SharedState,
     TaskContext,
     TaskPool,
@@ -19,6 +26,11 @@ from eventforge import (
 )
 
 
+@task()
+def module_level_task(x):
+    return x + 1
+
+
 class TestSharedState:
     def test_get_set(self):
         state = SharedState()
@@ -43,6 +55,118 @@ class TestSharedState:
         result = state.update("new_key", lambda x: (x or 0) + 10)
         assert result == 10
 
+    def test_compare_and_set(self):
+        state = SharedState()
+        assert state.compare_and_set("count", None, 1) is True  # missing == None
+        assert state.compare_and_set("count", 0, 5) is False
+        assert state.get("count") == 1
+        assert state.compare_and_set("count", 1, 2) is True
+        assert state.get("count") == 2
+
+    def test_compare_and_set_compares_identity(self):
+        state = SharedState()
+        state.set("flag", 1)
+        assert state.compare_and_set("flag", True, 0) is False  # 1 == True
+        config = {"lr": 0.1}
+        state.set("config", config)
+        state.set("config", {"lr": 0.1})  # replaced by an equal copy
+        assert state.compare_and_set("config", config, {}) is False
+        assert state.compare_and_set("config", state.get("config"), {}) is True
+
+    def test_compare_and_set_retry_loop_is_atomic(self):
+        state = SharedState()
+
+        def increment():
+            for _ in range(200):
+                while True:
+                    old = state.get("count")
+                    if state.compare_and_set("count", old, (old or 0) + 1):
+                        break
+
+        threads = [threading.Thread(target=increment) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert state.get("count") == 1600
+
+    def test_items_filtered_by_keys(self):
+        state = SharedState()
+        state.set("a", 1)
+        state.set("b", 2)
+        state.set("c", 3)
+
+        assert state.items() == {"a": 1, "b": 2, "c": 3}
+        assert state.items(["a", "c", "missing"]) == {"a": 1, "c": 3}
+
+        state.set("none", None)
+        assert "none" in state and "missing" not in state
+        assert state.items(["none", "missing"]) == {"none": None}
+
+    def test_republishing_same_object_skips_the_write(self):
+        state = SharedState()
+        config = {"lr": 0.1}
+        state.set("config", config)
+        shards = list(state._shards)
+
+        state.set("config", config)
+        assert all(a is b for a, b in zip(state._shards, shards))
+
+        state.set("config", {"lr": 0.1})  # equal but new object: stored
+        assert state.get("config") is not config
+
+    def test_writes_from_inside_update_func_are_rejected(self):
+        state = SharedState()
+        state.set("other", 1)
+
+        def writes_other(old):
+            state.set("other", 2)
+            return 1
+
+        with pytest.raises(RuntimeError, match="inside update"):
+            state.update("count", writes_other)
+        with pytest.raises(RuntimeError):
+            state.update("count", lambda old: state.update("x", lambda v: v))
+        assert state.get("other") == 1 and "count" not in state
+
+        # Reads stay allowed, and the guard is released afterwards.
+        assert state.update("count", lambda old: state.get("other") + 1) == 2
+        state.set("other", 3)
+        assert state.get("other") == 3
+
+    def test_snapshots_are_not_changed_by_later_writes(self):
+        state = SharedState()
+        state.set("a", 1)
+        snapshot = state.items()
+
+        state.set("a", 2)
+        state.delete("a")
+        state.clear()
+
+        assert snapshot == {"a": 1}
+        assert state.items() == {}
+
+    def test_updates_across_many_keys(self):
+        state = SharedState()
+        keys = [f"k{i}" for i in range(40)]
+
+        def bump():
+            for key in keys:
+                state.update(key, lambda x: (x or 0) + 1)
+
+        threads = [threading.Thread(target=bump) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert state.items() == {key: 4 for key in keys}
+        assert state.delete("k0") is True
+        assert "k0" not in state and "k1" in state
+        state.clear()
+        assert state.items() == {}
+
     def test_thread_safety(self):
         state = SharedState()
         state.set("count", 0)
@@ -60,6 +184,68 @@ class TestSharedState:
         assert state.get("count") == 1000
 
 
+class TestShardedCounter:
+    def test_add_and_get(self):
+        counter = ShardedCounter(initial=5)
+        counter.add()
+        counter.add(10)
+        assert counter.get() == 16
+
+    def test_counts_from_many_threads_survive_thread_exit(self):
+        counter = ShardedCounter()
+
+        def work():
+            for _ in range(1000):
+                counter.add()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert counter.get() == 8000
+
+    def test_exited_threads_release_their_slots(self):
+        counter = ShardedCounter(initial=1)
+        for _ in range(50):
+            t = threading.Thread(target=counter.add, args=(2,))
+            t.start()
+            t.join()
+        counter.add()  # the live main thread keeps its slot
+
+        gc.collect()
+        assert counter.get() == 102
+        assert len(counter._slots) == 1
+
+
+class TestAtomicInt:
+    def test_add_returns_new_value(self):
+        value = AtomicInt(5)
+        assert value.add() == 6
+        assert value.add(-2) == 4
+        assert value.get() == 4
+
+    def test_concurrent_adds_hand_out_unique_values(self):
+        value = AtomicInt()
+        seen = []
+        lock = threading.Lock()
+
+        def work():
+            mine = [value.add() for _ in range(1000)]
+            with lock:
+                seen.extend(mine)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(seen) == list(range(1, 8001))
+        assert value.get() == 8000
+
+
 class TestTaskContext:
     def test_execution_time(self):
         ctx = TaskContext(
@@ -105,6 +291,19 @@ class TestTaskDecorator:
         assert documented_function.__name__ == "documented_function"
         assert "doubles" in documented_function.__doc__
 
+    def test_task_binds_as_method_and_pickles_by_reference(self):
+        class Calculator:
+            def __init__(self, base):
+                self.base = base
+
+            @task()
+            def add(self, x):
+                return self.base + x
+
+        assert Calculator(40).add(2) == 42
+        assert pickle.loads(pickle.dumps(module_level_task)) is module_level_task
+        assert module_level_task(1) == 2
+
     def test_task_with_kwargs(self):
         @task()
         def greet(name, greeting="Hello"):
@@ -403,6 +602,146 @@ class TestTaskRunner:
 
         assert timing.stats["count"] == 2
 
+    def test_runner_lifecycle_logging_follows_level(self, caplog):
+        runner = TaskRunner(func=lambda x: x, topic="logged", executor=Executor())
+
+        with caplog.at_level(logging.WARNING, logger="eventforge.task"):
+            runner.run(1)
+        assert not caplog.records
+
+        with caplog.at_level(logging.INFO, logger="eventforge.task"):
+            runner.run(1)
+        assert [r.getMessage().split()[0] for r in caplog.records] == [
+            "task.start",
+            "task.success",
+        ]
+
+    def test_async_bodies_reuse_the_thread_loop(self):
+        loops = []
+
+        async def which_loop():
+            loops.append(asyncio.get_running_loop())
+
+        runner = TaskRunner(func=which_loop, topic="loop", executor=Executor())
+        runner.run()
+        runner.run()
+        assert len(loops) == 2 and loops[0] is loops[1]
+
+    def test_reused_loop_is_cleaned_between_calls_and_closed_with_thread(self):
+        leftovers, loops = [], []
+
+        async def spawn_stray():
+            loops.append(asyncio.get_running_loop())
+            leftovers.append(asyncio.ensure_future(asyncio.sleep(60)))
+
+        runner = TaskRunner(func=spawn_stray, topic="stray", executor=Executor())
+        t = threading.Thread(target=runner.run)
+        t.start()
+        t.join(timeout=5.0)
+        assert leftovers[0].cancelled()  # as asyncio.run would have done
+        for _ in range(3):
+            gc.collect()
+            if loops[0].is_closed():
+                break
+        assert loops[0].is_closed()
+
+    def test_calls_from_running_loops_are_not_serialized(self):
+        async def slow():
+            time.sleep(0.2)  # blocks its loop: a shared loop would serialize
+
+        runner = TaskRunner(func=slow, topic="slow", executor=Executor())
+
+        async def main():
+            runner.run()
+
+        threads = [
+            threading.Thread(target=lambda: asyncio.run(main())) for _ in range(4)
+        ]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5.0)
+        assert time.monotonic() - start < 0.6
+
+    def test_nested_sync_calls_to_async_tasks_do_not_deadlock(self):
+        async def leaf(x):
+            await asyncio.sleep(0)
+            return x + 1
+
+        leaf_runner = TaskRunner(func=leaf, topic="leaf", executor=Executor())
+
+        async def middle(x):
+            return leaf_runner.run(x) * 10
+
+        middle_runner = TaskRunner(func=middle, topic="middle", executor=Executor())
+
+        async def outer(x):
+            return middle_runner.run(x) + 1
+
+        outer_runner = TaskRunner(func=outer, topic="outer", executor=Executor())
+
+        async def main():
+            return outer_runner.run(1)
+
+        result = []
+        t = threading.Thread(
+            target=lambda: result.append(asyncio.run(main())), daemon=True
+        )
+        t.start()
+        t.join(timeout=5.0)
+        assert not t.is_alive(), "nested async task call deadlocked"
+        assert result == [21]
+
+    @pytest.mark.parametrize("mode", [ExecutionMode.SEQUENTIAL, ExecutionMode.THREAD])
+    def test_runner_awaits_async_function(self, mode):
+        async def fetch(x):
+            await asyncio.sleep(0)
+            return x + 1
+
+        results = []
+        with Executor(mode=mode) as executor:
+            runner = TaskRunner(
+                func=fetch,
+                topic="async",
+                executor=executor,
+                on_success=lambda ctx: results.append(ctx.result),
+            )
+            assert runner.run(1) == 2
+        assert results == [2]
+
+    def test_runner_accepts_callable_without_name(self):
+        seen = []
+        runner = TaskRunner(
+            func=functools.partial(pow, 2),
+            topic="test",
+            executor=Executor(),
+            on_success=lambda ctx: seen.append(ctx.func_name),
+        )
+
+        assert runner.run(5) == 32
+        assert seen and seen[0].startswith("functools.partial")
+
+    def test_runner_wires_plain_observer_methods(self):
+        class _Observer:
+            def __init__(self):
+                self.events = []
+
+            def on_start(self, ctx):
+                self.events.append("start")
+
+            def on_complete(self, ctx):
+                self.events.append("complete")
+
+        first, second = _Observer(), _Observer()
+        for obs in (first, second):
+            runner = TaskRunner(
+                func=lambda x: x, topic="test", executor=Executor(), on_execute=[obs]
+            )
+            runner.run(1)
+
+        assert first.events == second.events == ["start", "complete"]
+
 
 class TestTaskPool:
     def test_pool_creation(self):
@@ -458,6 +797,23 @@ class TestTaskPool:
         assert not acquired
         assert pool.active == 1  # Still only 1 active
 
+    def test_pool_waiter_counts_as_queued_until_slot_frees(self):
+        pool = TaskPool(max_instances=1)
+        pool.acquire()
+        assert pool.queued == 0  # a free slot is taken without queueing
+
+        waiter = threading.Thread(target=pool.acquire)
+        waiter.start()
+        deadline = time.time() + 2.0
+        while pool.queued != 1 and time.time() < deadline:
+            time.sleep(0.005)
+        assert pool.queued == 1
+
+        pool.release()
+        waiter.join(timeout=2.0)
+        assert pool.queued == 0
+        assert pool.active == 1
+
     def test_pool_timeout(self):
         pool = TaskPool(max_instances=1)
 
@@ -1,11 +1,20 @@
 """Tests for eventforge.transports module."""
 
+import socket
 import threading
 import time
 
 import pytest
 
 from eventforge.transports import MemoryTransport
+from eventforge.transports.tcp import (
+    TCPClientTransport,
+    _compile_topic_matcher,
+    _deserialize,
+    _recv_msg,
+    _send_msg,
+    _serialize,
+)
 from eventforge.types import Message
 
 
@@ -66,6 +75,52 @@ class TestMemoryTransport:
         assert len(received_messages) == 1
         assert received_messages[0].payload == "before"
 
+    def test_wildcard_subscriptions(self):
+        transport = MemoryTransport()
+        single, double = [], []
+        transport.subscribe("user.*", lambda m: single.append(m.topic))
+        transport.subscribe("user.**", lambda m: double.append(m.topic))
+
+        for topic in ("user.created", "user.a.b", "user", "other.created"):
+            transport.send(Message(topic=topic, payload=None))
+
+        assert single == ["user.created"]
+        assert double == ["user.created", "user.a.b"]
+
+    def test_question_mark_and_brackets_keep_fnmatch_meaning(self):
+        transport = MemoryTransport()
+        seen = []
+        transport.subscribe("job.v?", lambda m: seen.append(("any", m.topic)))
+        transport.subscribe("job.[ab]", lambda m: seen.append(("set", m.topic)))
+        transport.subscribe("job.[!ab]", lambda m: seen.append(("neg", m.topic)))
+
+        for topic in ("job.v1", "job.a", "job.c", "job.v12"):
+            transport.send(Message(topic=topic, payload=None))
+
+        assert seen == [
+            ("any", "job.v1"),
+            ("set", "job.a"),
+            ("neg", "job.c"),
+        ]
+
+    def test_callback_may_unsubscribe_during_send(self):
+        transport = MemoryTransport()
+        seen = []
+        sub_ids = {}
+
+        def once(msg):
+            seen.append(("once", msg.payload))
+            transport.unsubscribe(sub_ids["once"])
+
+        sub_ids["once"] = transport.subscribe("t", once)
+        transport.subscribe("t", lambda m: seen.append(("always", m.payload)))
+        transport.subscribe("other", lambda m: seen.append(("other", m.payload)))
+
+        transport.send(Message(topic="t", payload=1))
+        transport.send(Message(topic="t", payload=2))
+
+        assert seen == [("once", 1), ("always", 1), ("always", 2)]
+
     def test_close_prevents_send(self):
         transport = MemoryTransport()
 
@@ -133,3 +188,51 @@ class TestMemoryTransport:
             received.append(msg.payload)
 
         assert received == [0, 1, 2, 3, 4]
+
+
+class TestTCPRouting:
+    def test_exact_and_fnmatch_patterns(self):
+        exact = _compile_topic_matcher("svc.request")
+        assert exact("svc.request")
+        assert not exact("svc.requests")
+
+        wild = _compile_topic_matcher("svc.*")
+        assert wild("svc.request")
+        assert wild("svc.a.b")  # fnmatch ``*`` spans dots
+        assert not wild("other.request")
+
+    def test_dispatch_routes_follow_subscription_changes(self):
+        transport = TCPClientTransport()  # never connected; drive _dispatch
+        seen = []
+        sub_id = transport.subscribe("a.*", lambda m: seen.append(("wild", m.topic)))
+        transport._dispatch(Message(topic="a.b", payload=None))
+        transport.subscribe("a.c", lambda m: seen.append(("exact", m.topic)))
+        transport._dispatch(Message(topic="a.c", payload=None))
+        transport.unsubscribe(sub_id)
+        transport._dispatch(Message(topic="a.c", payload=None))
+
+        assert seen == [
+            ("wild", "a.b"),
+            ("wild", "a.c"),
+            ("exact", "a.c"),
+            ("exact", "a.c"),
+        ]
+
+
+class TestTCPFraming:
+    def test_round_trip_across_partial_reads(self):
+        left, right = socket.socketpair()
+        try:
+            msg = Message(topic="big", payload="x" * 200_000)
+            data = _serialize(msg)
+            sender = threading.Thread(target=_send_msg, args=(left, data))
+            sender.start()
+            received = _recv_msg(right)
+            sender.join()
+            assert _deserialize(received) == msg
+
+            left.close()
+            assert _recv_msg(right) is None
+        finally:
+            left.close()
+            right.close()
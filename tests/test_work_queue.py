@@ -2,6 +2,7 @@
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -47,6 +48,33 @@ class TestWorkQueueEnqueue:
         assert wq.pending_count("tasks") == 100
         wq.close()
 
+    def test_enqueue_accepts_headers_named_like_batch_parameters(self):
+        wq = WorkQueue()
+        wq.enqueue("tasks", "hello", payloads="p")
+        msg = wq.dequeue("tasks", timeout=1.0)
+        assert msg.headers["payloads"] == "p"
+        wq.close()
+
+    def test_enqueue_many_in_order(self):
+        wq = WorkQueue()
+        ids = wq.enqueue_many("tasks", ["a", "b", "c"], source="batch")
+        assert len(ids) == 3
+        received = [wq.dequeue("tasks", timeout=1.0) for _ in ids]
+        assert [m.payload for m in received] == ["a", "b", "c"]
+        assert [m.id for m in received] == ids
+        assert all(m.headers["source"] == "batch" for m in received)
+        wq.close()
+
+    def test_enqueue_many_is_all_or_nothing(self):
+        wq = WorkQueue(max_work_queue_size=3)
+        wq.enqueue("tasks", "a")
+        with pytest.raises(QueueFullError):
+            wq.enqueue_many("tasks", ["b", "c", "d"])
+        assert wq.pending_count("tasks") == 1
+        wq.enqueue_many("tasks", ["b", "c"])
+        assert wq.pending_count("tasks") == 3
+        wq.close()
+
 
 # ---------------------------------------------------------------------------
 # Dequeue
@@ -97,6 +125,49 @@ class TestWorkQueueDequeue:
         assert result == ["delayed"]
         wq.close()
 
+    def test_enqueue_wakes_one_waiter_per_message_on_its_topic(self):
+        wq = WorkQueue()
+        result = []
+        lock = threading.Lock()
+
+        def consumer(topic):
+            msg = wq.dequeue(topic, timeout=5.0)
+            if msg:
+                with lock:
+                    result.append((topic, msg.payload))
+
+        threads = [
+            threading.Thread(target=consumer, args=(topic,))
+            for topic in ("idle", "tasks", "tasks")
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        start = time.monotonic()
+        wq.enqueue_many("tasks", ["a", "b"])
+        for t in threads[1:]:
+            t.join(timeout=5.0)
+        elapsed = time.monotonic() - start
+
+        assert sorted(result) == [("tasks", "a"), ("tasks", "b")]
+        assert elapsed < 0.5  # woken by notify, not by the timeout
+        wq.close()
+        threads[0].join(timeout=5.0)
+
+    def test_waits_on_dynamic_topics_leave_no_conditions_behind(self):
+        wq = WorkQueue()
+        for i in range(20):
+            assert wq.dequeue(f"job.{i}", timeout=0.01) is None
+        waiter = threading.Thread(target=wq.dequeue, args=("tasks", 5.0))
+        waiter.start()
+        time.sleep(0.1)
+        assert list(wq._pending_conditions) == ["tasks"]
+        wq.enqueue("tasks", "x")
+        waiter.join(timeout=5.0)
+        assert wq._pending_conditions == {}
+        assert wq._pending_waiters == {}
+        wq.close()
+
     def test_dequeue_sets_delivery_id_header(self):
         wq = WorkQueue()
         wq.enqueue("tasks", "hello")
@@ -292,6 +363,20 @@ class TestWorkQueueCompetingConsumers:
         assert sorted(consumer_a + consumer_b) == [0, 1, 2, 3]
         wq.close()
 
+    def test_backlog_burst_keeps_round_robin_rotation(self):
+        wq = WorkQueue(inline_threshold=100)
+        seen = []
+        wq.enqueue_many("tasks", [0, 1, 2, 3, 4])
+        wq.consume("tasks", lambda m: seen.append(("a", m.payload)))
+        wq.consume("tasks", lambda m: seen.append(("b", m.payload)))
+        # consume() of "a" drained the whole backlog in one pass
+        wq.enqueue_many("tasks", [5, 6, 7])
+
+        assert seen == [("a", i) for i in range(5)] + [("a", 5), ("b", 6), ("a", 7)]
+        assert wq.pending_count("tasks") == 0
+        assert wq.in_flight_count("tasks") == 8
+        wq.close()
+
     def test_consume_different_groups_get_copies(self):
         wq = WorkQueue()
         group_a = []
@@ -321,6 +406,74 @@ class TestWorkQueueCompetingConsumers:
         assert len(call_count) >= 2
         wq.close()
 
+    def test_handlers_run_on_bounded_pool(self):
+        wq = WorkQueue(max_handler_workers=2)
+        names = []
+        wq.consume("tasks", lambda m: names.append(threading.current_thread().name))
+        for i in range(10):
+            wq.enqueue("tasks", i)
+        time.sleep(0.3)
+        assert len(names) == 10
+        assert all(name.startswith("eventforge-wq") for name in names)
+        assert len(set(names)) <= 2
+        wq.close()
+
+    def test_backlog_delivered_to_consumer_in_order(self):
+        wq = WorkQueue()
+        for i in range(5):
+            wq.enqueue("tasks", i)
+        seen = []
+        wq.consume(
+            "tasks",
+            lambda m: seen.append((m.payload, threading.current_thread().name)),
+        )
+        time.sleep(0.2)
+        # The whole backlog is one batch for this consumer: in order, one thread.
+        assert [payload for payload, _ in seen] == [0, 1, 2, 3, 4]
+        assert len({name for _, name in seen}) == 1
+        wq.close()
+
+    def test_same_handler_registered_twice_gets_separate_batches(self):
+        wq = WorkQueue(max_handler_workers=2)
+        barrier = threading.Barrier(2, timeout=2)
+        names = []
+
+        def handler(m):
+            barrier.wait()  # only passes if both consumers run concurrently
+            names.append(threading.current_thread().name)
+
+        wq.consume("tasks", handler)
+        wq.consume("tasks", handler)
+        wq.enqueue_many("tasks", [0, 1, 2, 3])
+        time.sleep(0.3)
+        assert len(names) == 4
+        assert len(set(names)) == 2
+        wq.close()
+
+    def test_inline_threshold_runs_handler_on_caller_thread(self):
+        wq = WorkQueue(inline_threshold=1)
+        names = []
+        wq.consume("tasks", lambda m: names.append(threading.current_thread().name))
+        wq.enqueue("tasks", "now")
+        # No sleep: the single delivery ran before enqueue() returned.
+        assert names == [threading.current_thread().name]
+        wq.close()
+
+    def test_enqueue_from_inline_handler_is_coalesced(self):
+        wq = WorkQueue(inline_threshold=1)
+        seen = []
+
+        def handler(m):
+            seen.append(m.payload)
+            if m.payload < 500:
+                # Folded into the running drain's next pass, not a nested one.
+                wq.enqueue("tasks", m.payload + 1)
+
+        wq.consume("tasks", handler)
+        wq.enqueue("tasks", 0)
+        assert seen == list(range(501))
+        wq.close()
+
     def test_remove_consumer(self):
         wq = WorkQueue()
         received = []
@@ -396,6 +549,23 @@ class TestWorkQueueVisibilityTimeout:
         assert msg2 is None
         wq.close()
 
+    def test_batched_messages_do_not_expire_while_waiting_their_turn(self):
+        wq = WorkQueue(default_visibility_timeout=0.5, reaper_interval=0.05)
+        delivered = []
+
+        def handler(m):
+            delivered.append(m.payload)
+            time.sleep(0.1)
+            wq.ack(m.headers["_wq_delivery_id"])
+
+        wq.consume("t", handler)
+        wq.enqueue_many("t", list(range(10)))
+        time.sleep(1.5)
+        # Each run is well under the timeout, so nothing is redelivered even
+        # though the whole batch takes twice as long.
+        assert delivered == list(range(10))
+        wq.close()
+
 
 # ---------------------------------------------------------------------------
 # Pub/Sub Coexistence
@@ -524,6 +694,15 @@ class TestWorkQueueLifecycle:
         wq.close()
         assert wq._reaper_thread is None or not wq._reaper_thread.is_alive()
 
+    def test_close_wakes_sleeping_reaper(self):
+        wq = WorkQueue(reaper_interval=10.0)
+        wq.enqueue("tasks", "x")
+        wq.dequeue("tasks", timeout=1.0)  # starts reaper
+        time.sleep(0.05)  # let it finish its first sweep and go to sleep
+        start = time.monotonic()
+        wq.close()
+        assert time.monotonic() - start < 1.0
+
     def test_close_unblocks_dequeue(self):
         wq = WorkQueue()
         result = [None]
@@ -539,6 +718,19 @@ class TestWorkQueueLifecycle:
         assert result[0] is None
         assert not t.is_alive()
 
+    def test_shared_handler_pool_outlives_close(self):
+        with ThreadPoolExecutor(2) as pool:
+            done = threading.Event()
+            first, second = WorkQueue(handler_pool=pool), WorkQueue(handler_pool=pool)
+            first.consume("tasks", lambda m: None)
+            first.enqueue("tasks", "a")
+            first.close()
+
+            second.consume("tasks", lambda m: done.set())
+            second.enqueue("tasks", "b")
+            assert done.wait(timeout=2.0)
+            second.close()
+
     def test_pending_count(self):
         wq = WorkQueue()
         wq.enqueue("tasks", "a")